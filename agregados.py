@@ -0,0 +1,233 @@
+import numpy as np
+import pandas as pd
+
+# ------------------ Constantes ------------------
+DIAS_ORDEN = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+DIAS_ES = {
+    'Monday': 'Lunes', 'Tuesday': 'Martes', 'Wednesday': 'Miércoles',
+    'Thursday': 'Jueves', 'Friday': 'Viernes', 'Saturday': 'Sábado', 'Sunday': 'Domingo'
+}
+VENTANA_SUAVIZADO = 7
+INTERVALO_MINUTOS = 15
+
+
+# ------------------ Métricas ------------------
+def calcular_kpis(df):
+    total_llamadas = int(df["Call Id"].count())
+    resueltas = int((df["Resolved"] == "Y").sum())
+    return {
+        "total_llamadas": total_llamadas,
+        "Q_agentes": int(df["Agent"].nunique()),
+        "resueltas": resueltas,
+        "pct_resueltas": round((resueltas / total_llamadas) * 100, 2) if total_llamadas else 0,
+        "R_porSegundo_resueltas": (
+            round(float(df.loc[df["Resolved"] == "Y", "Speed of answer in seconds"].mean()), 2) if resueltas else 0
+        ),
+        "satisfaccion": (
+            round(float(df["Satisfaction rating"].mean()), 2) if not df["Satisfaction rating"].isna().all() else 0
+        ),
+    }
+
+
+# ------------------ Llamadas ------------------
+def llamadas_por_tema(df):
+    calls_por_topic = df['Topic'].value_counts().reset_index()
+    calls_por_topic.columns = ['Topic', 'Count']
+    return calls_por_topic
+
+
+def resumen_semanal(df):
+    summary = (
+        df.assign(DayOfWeek=df['Date'].dt.day_name())
+        .groupby('DayOfWeek')
+        .agg(
+            Llamadas=('Call Id', 'count'),
+            Atendidas=('Answered', lambda x: (x == 'Y').sum()),
+            Resueltas=('Resolved', lambda x: (x == 'Y').sum())
+        )
+        .reset_index()
+    )
+    summary['DayOfWeek'] = pd.Categorical(summary['DayOfWeek'], categories=DIAS_ORDEN, ordered=True)
+    summary = summary.sort_values('DayOfWeek')
+    summary['Día'] = summary['DayOfWeek'].map(DIAS_ES)
+    return summary[['Día', 'Llamadas', 'Atendidas', 'Resueltas']].reset_index(drop=True)
+
+
+def atendidas_diarias(df):
+    """Llamadas atendidas por día, suavizadas con media móvil centrada."""
+    attended_per_day = df[df['Answered'] == 'Y'].groupby('Date').size().sort_index()
+    return attended_per_day.rolling(window=VENTANA_SUAVIZADO, min_periods=1, center=True).mean()
+
+
+# ------------------ Agentes ------------------
+def tabla_agentes(df):
+    agent_tbl = df.groupby('Agent').agg(
+        Total_Llamadas=('Call Id', 'count'),
+        Atendidas=('Answered', lambda x: (x == 'Y').sum()),
+        Resueltas=('Resolved', lambda x: (x == 'Y').sum())
+    ).reset_index()
+    agent_tbl['No_Resueltas'] = agent_tbl['Atendidas'] - agent_tbl['Resueltas']
+    return agent_tbl
+
+
+def resueltas_mensuales(df):
+    resolved_ts = df[df['Resolved'] == 'Y'].groupby('Date').size().sort_index()
+    resolved_ts.index = pd.to_datetime(resolved_ts.index)
+    return resolved_ts.resample('MS').sum()
+
+
+def dias_desde_epoca(index):
+    """Fechas como días desde 1970-01-01 (equivalente a `mdates.date2num`)."""
+    return ((pd.DatetimeIndex(index) - pd.Timestamp("1970-01-01")) / pd.Timedelta(days=1)).to_numpy()
+
+
+def coeficientes_tendencia(serie):
+    """Regresión lineal de la serie contra la fecha; None si no hay puntos suficientes."""
+    if len(serie) < 2:
+        return None
+    return np.polyfit(dias_desde_epoca(serie.index), serie.to_numpy(dtype=float), 1)
+
+
+def evaluar_tendencia(coef, index):
+    return np.polyval(coef, dias_desde_epoca(index))
+
+
+# ------------------ Temas ------------------
+def satisfaccion_por_tema(df):
+    satisfaction_by_topic = df.groupby('Topic')['Satisfaction rating'].mean().reset_index()
+    return satisfaction_by_topic.sort_values('Satisfaction rating', ascending=False)
+
+
+def tabla_temas(df):
+    topic_counts = df.groupby('Topic').agg(
+        Total=('Call Id', 'count'),
+        Resueltas=('Resolved', lambda x: (x == 'Y').sum())
+    ).reset_index()
+    topic_counts['No_Resueltas'] = topic_counts['Total'] - topic_counts['Resueltas']
+    topic_counts['% Resueltas'] = (topic_counts['Resueltas'] / topic_counts['Total'] * 100).round(1)
+    return topic_counts
+
+
+def kpis_por_tema(df):
+    topic_kpis = df.groupby('Topic').agg(
+        Prom_Satisfacción=('Satisfaction rating', 'mean'),
+        Prom_Speed=('Speed of answer in seconds', 'mean'),
+        Llamadas=('Call Id', 'count')
+    ).reset_index().sort_values('Llamadas', ascending=False)
+    topic_kpis['Prom_Satisfacción'] = topic_kpis['Prom_Satisfacción'].round(2)
+    topic_kpis['Prom_Speed'] = topic_kpis['Prom_Speed'].round(1)
+    return topic_kpis
+
+
+def no_atendidas_por_tema(df):
+    not_answered = df[df['Answered'] != 'Y'].groupby('Topic').size().reset_index(name='No_Atendidas')
+    return not_answered.sort_values('No_Atendidas', ascending=False)
+
+
+# ------------------ Reportes por agente / tema ------------------
+def inicio_semana(fechas):
+    """Lunes de la semana (lunes a domingo) de cada fecha."""
+    return fechas.dt.to_period('W-SUN').dt.start_time
+
+
+def cubo_agente_tema(df):
+    """Totales por (semana, agente, tema): cada reporte se arma filtrando este cubo, sin reagrupar el dataset."""
+    cubo = (
+        df.assign(Semana=inicio_semana(df['Date']), Atendidas=df['Answered'].eq('Y'), Resueltas=df['Resolved'].eq('Y'))
+        .groupby(['Semana', 'Agent', 'Topic'])
+        .agg(
+            Total_Llamadas=('Call Id', 'count'),
+            Atendidas=('Atendidas', 'sum'),
+            Resueltas=('Resueltas', 'sum'),
+            Suma_Satisfacción=('Satisfaction rating', 'sum'),
+        )
+        .reset_index()
+    )
+    cubo['No_Atendidas'] = cubo['Total_Llamadas'] - cubo['Atendidas']
+    return cubo
+
+
+def resumen_cubo(cubo, etiqueta):
+    """Colapsa un corte del cubo por `etiqueta` ('Agent' o 'Topic')."""
+    tabla = cubo.groupby(etiqueta)[
+        ['Total_Llamadas', 'Atendidas', 'Resueltas', 'No_Atendidas', 'Suma_Satisfacción']
+    ].sum().reset_index()
+    tabla['Satisfacción'] = (tabla['Suma_Satisfacción'] / tabla['Total_Llamadas']).round(2)
+    return tabla.sort_values('Total_Llamadas', ascending=False)
+
+
+def resueltas_mensuales_por(df, columna):
+    """Matriz mes × grupo de llamadas resueltas (una columna por agente o tema)."""
+    resueltas = df[df['Resolved'] == 'Y']
+    return (
+        resueltas.groupby([pd.Grouper(key='Date', freq='MS'), columna]).size()
+        .unstack(fill_value=0)
+        .reindex(columns=sorted(df[columna].dropna().unique()), fill_value=0)
+        .sort_index()
+        .asfreq('MS', fill_value=0)
+    )
+
+
+# ------------------ Tendencias por agente / tema (small multiples) ------------------
+def atendidas_diarias_por(df, columna):
+    """Matriz día × grupo de llamadas atendidas: una columna por agente o tema, sin huecos de fechas."""
+    atendidas = df[df['Answered'] == 'Y']
+    return (
+        atendidas.groupby(['Date', columna]).size()
+        .unstack(fill_value=0)
+        .reindex(columns=sorted(df[columna].dropna().unique()), fill_value=0)
+        .sort_index()
+        .asfreq('D', fill_value=0)
+    )
+
+
+def periodo_multiples(matriz, periodo):
+    """Lleva la matriz diaria al período pedido de una sola vez para todas las series.
+
+    "Diario" suaviza con la misma media móvil que la tendencia de `llamadas.py`;
+    "Mensual" suma por mes.
+    """
+    if periodo == "Mensual":
+        return matriz.resample('MS').sum()
+    return matriz.rolling(window=VENTANA_SUAVIZADO, min_periods=1, center=True).mean()
+
+
+# ------------------ Dimensionamiento (Erlang C) ------------------
+def _segundos(horas):
+    """Columna de horas (datetime.time o "HH:MM:SS") a segundos; vacíos/inválidos como NaN."""
+    return pd.to_timedelta(horas.astype(str), errors='coerce').dt.total_seconds()
+
+
+def llegadas_por_intervalo(df, minutos=INTERVALO_MINUTOS, peso=None):
+    """Llamadas promedio por intervalo de una semana tipo (día de la semana × franja de `minutos`).
+
+    Cada conteo se divide por cuántas veces aparece ese día de la semana en el
+    rango de fechas del dataset, contando también los días sin llamadas. `peso`
+    es una columna opcional de pesos muestrales.
+    """
+    franjas = 24 * 60 // minutos
+    fechas = df['Date'].dropna()
+    dias = pd.date_range(fechas.min(), fechas.max(), freq='D')
+    semanas = pd.Series(dias.dayofweek).value_counts().reindex(range(7), fill_value=0)
+
+    llamadas = pd.DataFrame({
+        'Dia': df['Date'].dt.dayofweek,
+        'Franja': _segundos(df['Time']) // (minutos * 60),
+        'Llamadas': df[peso] if peso else 1.0,
+    }).dropna()
+    conteo = (
+        llamadas.groupby(['Dia', 'Franja'])['Llamadas'].sum()
+        .reindex(pd.MultiIndex.from_product([range(7), range(franjas)], names=['Dia', 'Franja']), fill_value=0)
+    )
+    promedio = conteo / semanas.reindex(conteo.index.get_level_values('Dia')).clip(lower=1).to_numpy()
+    return promedio.rename('Llamadas').reset_index()
+
+
+def duracion_media(df, peso=None):
+    """AHT en segundos: promedio de `AvgTalkDuration` de las llamadas atendidas con duración."""
+    segundos = _segundos(df['AvgTalkDuration'])
+    validas = df['Answered'].eq('Y') & (segundos > 0)
+    if not validas.any():
+        return 0.0
+    pesos = df.loc[validas, peso] if peso else None
+    return float(np.average(segundos[validas], weights=pesos))
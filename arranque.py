@@ -0,0 +1,145 @@
+"""Andamiaje común de las páginas: configuración, estilos, menú lateral y tarjetas KPI.
+
+Todo lo que no depende de la ejecución (CSS, menú, plantilla de tarjetas) se arma
+una sola vez al importar el módulo; cada página solo lo emite.
+"""
+import streamlit as st
+
+from muestreo import con_ic
+from precarga import programador
+
+# ------------------ Menú ------------------
+# (nombre, icono, archivo)
+MENU = [
+    ("Llamadas", "📞", "llamadas.py"),
+    ("Agentes", "👥", "pages/agentes.py"),
+    ("Temas", "📄", "pages/temas.py"),
+    ("Personal", "🧮", "pages/personal.py"),
+]
+
+# ------------------ CSS: oculta el menú predeterminado y estiliza el propio ------------------
+CSS = """
+    <style>
+        /* Oculta la navegación de páginas automática */
+        [data-testid="stSidebarNav"] {
+            display: none !important;
+        }
+
+        /* También oculta el contenedor del título predeterminado */
+        [data-testid="stSidebarNavItems"] {
+            display: none !important;
+        }
+
+        /* Asegura que tu propio menú quede arriba sin espacios vacíos */
+        section[data-testid="stSidebar"] div:nth-child(1) {
+            padding-top: 0 !important;
+        }
+
+        section[data-testid="stSidebar"] {
+            background-color: #F8F9FB;
+        }
+        .active {
+            background-color: #DDE3EC;
+            border-radius: 10px;
+            font-weight: 600;
+        }
+        button[kind="secondary"] {
+            width: 100%;
+            text-align: left;
+            background-color: transparent;
+            border-radius: 10px;
+        }
+        button[kind="secondary"]:hover {
+            background-color: #E9ECEF;
+        }
+    </style>
+"""
+
+# ------------------ Tarjetas personalizadas ------------------
+CARD_STYLE = """
+<div style="
+    background-color:#F8F9FB;
+    padding:15px;
+    border-radius:15px;
+    text-align:center;
+    box-shadow: 0px 2px 8px rgba(0,0,0,0.1);
+    border:2px solid #E5E7EB;
+    height:150px;
+    display:flex;
+    flex-direction:column;
+    justify-content:center;
+">
+    <h3 style="
+        color:#2B2D42;
+        font-size:1.1rem;
+        margin-bottom:8px;
+        font-weight:600;
+        line-height:1.2;
+        word-wrap:break-word;
+        white-space:normal;
+    ">{}</h3>
+    <h2 style="
+        color:#D6457B;
+        font-size:1.8rem;
+        font-weight:700;
+        margin:0;
+        line-height:1.1;
+    ">{}</h2>
+</div>
+"""
+
+# clave de snap["kpis"] -> (título, formato del valor, sufijo del intervalo en vista previa)
+TARJETAS = {
+    "total_llamadas": ("🎫 Total Llamadas", "{:,}", ""),
+    "Q_agentes": ("👩‍💻 Agentes", "{}", ""),
+    "pct_resueltas": ("✅ % Resueltas", "{}%", "%"),
+    "R_porSegundo_resueltas": ("⚡ Prom. Respuesta (s)", "{}", ""),
+    "satisfaccion": ("⭐ Satisfacción", "{}", ""),
+}
+
+
+def iniciar_pagina(titulo):
+    """Configuración, CSS, menú lateral y título: lo mismo en todas las páginas."""
+    st.set_page_config(
+        page_title="Call center",
+        page_icon="📞",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(CSS, unsafe_allow_html=True)
+
+    st.sidebar.markdown("### 📞 Centro de llamadas")
+
+    # Guardamos en la sesión la opción seleccionada
+    if "selected_page" not in st.session_state:
+        st.session_state.selected_page = MENU[0][0]
+
+    for nombre, icono, archivo in MENU:
+        if st.sidebar.button(f"{icono} {nombre}", key=nombre):
+            st.session_state.selected_page = nombre
+            st.switch_page(archivo)  # ⬅ Cambio de página real
+
+    st.title(titulo)
+
+
+def precargar_otras(pagina):
+    """Se llama al final de la página: la precarga no compite con el primer dibujo."""
+    programador.calentar(pagina)
+
+
+def mostrar_tarjetas(pares):
+    """Hasta tres tarjetas (título, valor) en las columnas 1, 3 y 5."""
+    columnas = st.columns(5)
+    for col, (titulo, valor) in zip(columnas[::2], pares):
+        with col:
+            st.markdown(CARD_STYLE.format(titulo, valor), unsafe_allow_html=True)
+    st.markdown("---")
+
+
+def tarjetas_kpi(snap, claves):
+    """Tarjetas de los KPIs `claves` del snapshot (con su intervalo si es una vista previa)."""
+    tarjetas = []
+    for clave in claves:
+        titulo, formato, sufijo = TARJETAS[clave]
+        tarjetas.append((titulo, con_ic(snap, clave, formato.format(snap["kpis"][clave]), sufijo)))
+    mostrar_tarjetas(tarjetas)
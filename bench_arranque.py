@@ -0,0 +1,88 @@
+"""Benchmark de arranque de las páginas.
+
+Para cada página mide, en un proceso nuevo (como tras reiniciar el worker):
+
+- import: lo que tardan en importarse los módulos de primer nivel de la página,
+- frío: la primera ejecución completa del script,
+- tibio: una segunda ejecución inmediata en el mismo proceso (cambio rápido de
+  página / rerun), que compite con la precarga en segundo plano si la hay,
+- tras pausa: otra ejecución tras `--pausa` segundos, como el usuario que mira la
+  página antes de interactuar,
+
+y si con solo importar la página ya se carga matplotlib. Usa el
+snapshot ya generado (correr antes `python precalculo.py`) para medir el
+arranque y no el cálculo.
+
+    python bench_arranque.py --repeticiones 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PAGINAS = ["llamadas.py", "pages/agentes.py", "pages/temas.py", "pages/personal.py"]
+
+# Se ejecuta en un proceso aparte por medición
+_MEDIR = r"""
+import ast, json, sys, time
+pagina, pausa = sys.argv[1], float(sys.argv[2])
+modulos = [n.names[0].name if isinstance(n, ast.Import) else n.module
+           for n in ast.parse(open(pagina, encoding="utf-8").read()).body
+           if isinstance(n, (ast.Import, ast.ImportFrom))]
+
+t0 = time.perf_counter()
+for modulo in modulos:
+    __import__(modulo)
+t_import = time.perf_counter() - t0
+mpl_tras_import = "matplotlib" in sys.modules
+
+from streamlit.testing.v1 import AppTest
+t0 = time.perf_counter()
+at = AppTest.from_file(pagina, default_timeout=300).run()
+t_frio = time.perf_counter() - t0
+t0 = time.perf_counter()
+at.run()
+t_tibio = time.perf_counter() - t0
+time.sleep(pausa)
+t0 = time.perf_counter()
+at.run()
+t_pausa = time.perf_counter() - t0
+if at.exception:
+    raise SystemExit(f"{pagina}: {at.exception[0].value}")
+print(json.dumps({"import": t_import, "frio": t_frio, "tibio": t_tibio, "pausa": t_pausa, "mpl": mpl_tras_import}))
+"""
+
+
+def medir(pagina, raiz, pausa):
+    entorno = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [raiz, os.environ.get("PYTHONPATH")])))
+    salida = subprocess.run([sys.executable, "-c", _MEDIR, pagina, str(pausa)], cwd=raiz, env=entorno,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(salida.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide el tiempo de arranque de las páginas del dashboard.")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Procesos por página (se informa la mediana)")
+    parser.add_argument("--raiz", default=os.path.dirname(os.path.abspath(__file__)),
+                        help="Directorio del proyecto a medir (por defecto: este)")
+    parser.add_argument("--pausa", type=float, default=3.0,
+                        help="Segundos de espera antes de la última ejecución")
+    parser.add_argument("paginas", nargs="*", default=PAGINAS)
+    args = parser.parse_args(argv)
+
+    print(f"{'Página':<20}{'import (ms)':>12}{'frío (ms)':>12}{'tibio (ms)':>12}"
+          f"{'tras pausa (ms)':>17}  matplotlib al importar")
+    for pagina in args.paginas:
+        if not os.path.exists(os.path.join(args.raiz, pagina)):
+            continue
+        medidas = [medir(pagina, args.raiz, args.pausa) for _ in range(args.repeticiones)]
+        mediana = {k: statistics.median(m[k] for m in medidas) * 1000 for k in ("import", "frio", "tibio", "pausa")}
+        print(f"{pagina:<20}{mediana['import']:>12.0f}{mediana['frio']:>12.0f}{mediana['tibio']:>12.0f}"
+              f"{mediana['pausa']:>17.0f}"
+              f"  {'sí' if medidas[0]['mpl'] else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Los tests importan los módulos de la raíz (erlang, muestreo, ...) igual que las páginas
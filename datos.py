@@ -0,0 +1,44 @@
+import functools
+import hashlib
+import os
+
+import pandas as pd
+
+# ------------------ Dataset ------------------
+RUTA_DATASET = "Data/01 Call-Center-Dataset.xlsx"
+
+
+def huella_dataset(ruta=RUTA_DATASET):
+    """Identifica el contenido del archivo (tamaño, SHA-256) para invalidar cachés.
+
+    No depende de la ruta ni de la fecha de modificación: un snapshot generado por
+    cron en otra copia del proyecto sigue valiendo. El hash solo se recalcula
+    cuando cambian la fecha o el tamaño del archivo.
+    """
+    info = os.stat(ruta)
+    return _huella(os.path.abspath(ruta), info.st_mtime_ns, info.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _huella(ruta, mtime_ns, tamano):
+    sha = hashlib.sha256()
+    with open(ruta, "rb") as f:
+        for bloque in iter(lambda: f.read(1 << 20), b""):
+            sha.update(bloque)
+    return (tamano, sha.hexdigest())
+
+
+def cargar_llamadas(ruta=RUTA_DATASET):
+    """Lee el dataset y aplica la misma normalización que usan las páginas."""
+    df = pd.read_excel(ruta)
+
+    # Rellenar vacíos
+    df["Speed of answer in seconds"] = pd.to_numeric(df["Speed of answer in seconds"], errors="coerce").fillna(0)
+    df["Satisfaction rating"] = pd.to_numeric(df["Satisfaction rating"], errors="coerce").fillna(0)
+    df["AvgTalkDuration"] = df["AvgTalkDuration"].fillna(0)
+
+    # Normalizar fechas y columnas clave
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+    df["Answered"] = df["Answered (Y/N)"].fillna("N").astype(str)
+    df["Resolved"] = df["Resolved"].fillna("N").astype(str)
+    return df
@@ -0,0 +1,98 @@
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from precarga import programador
+
+# ------------------ Configuración del detalle ------------------
+COLUMNAS = [
+    "Call Id", "Agent", "Date", "Time", "Topic", "Answered (Y/N)",
+    "Resolved", "Speed of answer in seconds", "AvgTalkDuration", "Satisfaction rating",
+]
+AGRUPADORES = ["Topic", "Agent"]
+TAM_PAGINA = 25
+
+
+class AlmacenLlamadas:
+    """Registros de llamadas indexados por tema/agente y ordenables en el servidor.
+
+    Cada consulta devuelve solo la página pedida con las columnas pedidas; el
+    resto del frame nunca sale del servidor. Se guarda un único orden global por
+    columna y sentido (no uno por grupo): el grupo se filtra sobre ese orden.
+    """
+
+    def __init__(self, df):
+        df = df[COLUMNAS].reset_index(drop=True)
+        # Horas y duraciones como texto "HH:MM:SS": se ordenan igual y viajan bien a Arrow
+        for col in ("Time", "AvgTalkDuration"):
+            df[col] = df[col].astype(str)
+        self._df = df
+        # Por agrupador: código de grupo de cada fila, código de cada valor y filas por grupo
+        self._grupos = {}
+        for col in AGRUPADORES:
+            codigos, valores = pd.factorize(df[col])
+            conteos = np.bincount(codigos[codigos >= 0], minlength=len(valores))
+            self._grupos[col] = (codigos, {v: i for i, v in enumerate(valores)}, conteos)
+        self._ordenes = {}
+
+    def total(self, columna, valor):
+        _, codigo, conteos = self._grupos[columna]
+        return int(conteos[codigo[valor]]) if valor in codigo else 0
+
+    def _orden(self, orden_por, ascendente):
+        """Todas las filas ordenadas por `orden_por`, con los vacíos al final en ambos sentidos."""
+        clave = (orden_por, ascendente)
+        if clave not in self._ordenes:
+            codigos, valores = pd.factorize(self._df[orden_por], sort=True)
+            vacio = len(valores)
+            rango = np.where(codigos < 0, vacio, codigos)
+            if not ascendente:
+                # Se invierte solo el orden de los valores: los vacíos siguen al final
+                rango = np.where(rango == vacio, vacio, vacio - 1 - rango)
+            self._ordenes[clave] = np.argsort(rango, kind="stable")
+        return self._ordenes[clave]
+
+    def pagina(self, columna, valor, orden_por, ascendente=True, pagina=1, columnas=None):
+        """Devuelve la página `pagina` (base 1) de las llamadas con `columna == valor`."""
+        codigos, codigo, _ = self._grupos[columna]
+        orden = self._orden(orden_por, ascendente)
+        # Un valor inexistente no coincide con ninguna fila (-1 es el código de los vacíos)
+        orden = orden[codigos[orden] == codigo.get(valor, -2)]
+        inicio = (pagina - 1) * TAM_PAGINA
+        filas = orden[inicio:inicio + TAM_PAGINA]
+        # Primero las filas: `iloc[filas, cols]` copia las columnas enteras antes de recortar
+        return self._df.iloc[filas][columnas or COLUMNAS].reset_index(drop=True)
+
+
+def obtener_almacen():
+    """Almacén compartido por todas las sesiones; se arma la primera vez que se abre un detalle."""
+    with st.spinner("Indexando llamadas..."):
+        return programador.obtener("almacen")
+
+
+# ------------------ Vista de detalle ------------------
+def mostrar_detalle(columna, valor, clave):
+    """Muestra las llamadas de `valor` paginadas, con orden y columnas elegidas por el usuario."""
+    almacen = obtener_almacen()
+    total = almacen.total(columna, valor)
+    n_paginas = max(1, math.ceil(total / TAM_PAGINA))
+
+    st.markdown(f"#### 🔎 Llamadas · {valor}")
+    d1, d2, d3, d4 = st.columns([25, 15, 45, 15])
+    orden_por = d1.selectbox("Ordenar por", COLUMNAS, index=COLUMNAS.index("Date"), key=f"{clave}_orden")
+    ascendente = d2.toggle("Ascendente", value=False, key=f"{clave}_asc")
+    columnas = d3.multiselect("Columnas", COLUMNAS, default=COLUMNAS, key=f"{clave}_cols")
+    pagina = d4.number_input("Página", min_value=1, max_value=n_paginas, value=1, step=1,
+                             key=f"{clave}_{valor}_pagina")
+
+    tabla = almacen.pagina(columna, valor, orden_por, ascendente, int(pagina), columnas or None)
+    st.dataframe(tabla, use_container_width=True, hide_index=True)
+    st.caption(f"{total:,} llamadas · página {int(pagina)} de {n_paginas}")
+
+
+def fila_seleccionada(evento, tabla, columna):
+    """Valor de `columna` en la fila elegida de un `st.dataframe(on_select=...)`, o None."""
+    filas = evento.selection.rows if evento else []
+    return tabla.iloc[filas[0]][columna] if filas else None
@@ -0,0 +1,76 @@
+"""Erlang C vectorizado para dimensionar agentes.
+
+Todo se evalúa de una vez sobre la grilla intervalos × cantidad de agentes y en
+espacio logarítmico: a^N/N! desborda con pocos cientos de agentes, sus
+logaritmos no.
+"""
+import numpy as np
+
+
+def agentes_maximos(trafico):
+    """Tope de la grilla de agentes: holgado respecto del pico de tráfico (en Erlangs)."""
+    pico = float(np.max(trafico, initial=0))
+    return int(np.ceil(pico + 10 * np.sqrt(pico) + 10))
+
+
+def log_erlang_c(trafico, max_agentes):
+    """log P(espera) para cada intervalo (filas) y N = 1..max_agentes (columnas).
+
+    Con N <= a la cola no es estable y la probabilidad de esperar es 1 (log = 0).
+    """
+    a = np.asarray(trafico, dtype=float)[:, None]
+    k = np.arange(max_agentes + 1)
+    log_factorial = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, max_agentes + 1)))))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # log(a^k / k!) para k = 0..max_agentes (con a = 0 solo sobrevive k = 0)
+        log_terminos = np.where(k == 0, 0.0, k * np.log(a)) - log_factorial
+        # log Σ_{k<N} a^k/k! para N = 1..max_agentes, acumulado de una pasada
+        log_suma = np.logaddexp.accumulate(log_terminos[:, :-1], axis=1)
+
+        N = k[1:]
+        holgura = N - a
+        log_cola = log_terminos[:, 1:] + np.log(N) - np.log(holgura)
+        log_c = log_cola - np.logaddexp(log_suma, log_cola)
+    return np.where(holgura > 0, log_c, 0.0)
+
+
+def nivel_servicio(trafico, aht, tiempo_objetivo, max_agentes):
+    """Nivel de servicio (fracción atendida antes de `tiempo_objetivo` s) y ASA en segundos.
+
+    Ambas matrices tienen forma intervalos × max_agentes; la columna j es N = j + 1.
+    """
+    a = np.asarray(trafico, dtype=float)[:, None]
+    N = np.arange(1, max_agentes + 1)
+    holgura = N - a
+    estable = holgura > 0
+    log_c = log_erlang_c(trafico, max_agentes)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        sl = 1 - np.exp(log_c - holgura * tiempo_objetivo / aht)
+        asa = np.exp(log_c) * aht / holgura
+    return np.where(estable, sl, 0.0), np.where(estable, asa, np.inf)
+
+
+def agentes_necesarios(trafico, aht, sl_objetivo, tiempo_objetivo, max_agentes=None):
+    """Mínimo de agentes por intervalo para llegar al nivel de servicio objetivo.
+
+    Devuelve (agentes, sl, asa, alcanzado) con el nivel de servicio y el ASA que se
+    obtienen con esa dotación. Donde ninguna cantidad de la grilla llega al objetivo,
+    `alcanzado` es False y se informa `max_agentes`. Los intervalos sin tráfico
+    requieren 0 agentes.
+    """
+    trafico = np.asarray(trafico, dtype=float)
+    if max_agentes is None:
+        max_agentes = agentes_maximos(trafico)
+    sl, asa = nivel_servicio(trafico, aht, tiempo_objetivo, max_agentes)
+    cumple = sl >= sl_objetivo
+    columna = cumple.argmax(axis=1)
+    filas = np.arange(len(trafico))
+    alcanzado = cumple.any(axis=1)
+    agentes = np.where(alcanzado, columna + 1, max_agentes)
+    sin_trafico = trafico <= 0
+    return (
+        np.where(sin_trafico, 0, agentes),
+        np.where(sin_trafico, 1.0, sl[filas, agentes - 1]),
+        np.where(sin_trafico, 0.0, asa[filas, agentes - 1]),
+        alcanzado | sin_trafico,
+    )
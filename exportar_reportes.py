@@ -0,0 +1,140 @@
+"""Exportación en lote de reportes semanales por agente y por tema.
+
+Cada reporte reúne los mismos gráficos que `pages/agentes.py` y `pages/temas.py`,
+filtrados a un agente o a un tema y a una semana (lunes a domingo); la tendencia
+mensual, como contexto, llega hasta el mes de esa semana. Los datos salen del snapshot precalculado
+(ver `precalculo.py`): cada reporte recibe solo su corte de los agregados y se
+dibuja en un pool de procesos.
+
+    python exportar_reportes.py --semana 2021-03-22 --salida reportes --formatos png pdf --procesos 8
+"""
+import argparse
+import os
+import re
+import time
+from datetime import date
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib
+import pandas as pd
+from matplotlib.figure import Figure
+
+import agregados as ag
+from graficos import PALETTE, aplicar_estilo, barras_atendidas_resueltas, barras_por_categoria, linea_tendencia_mensual
+from snapshot import obtener_snapshot
+
+FORMATOS = ("png", "pdf")
+
+
+# ------------------ Trabajos ------------------
+def _nombre_archivo(nombre):
+    return re.sub(r"[^\w-]+", "_", str(nombre)).strip("_") or "sin_nombre"
+
+
+def semana_del_reporte(cubo, fecha=None):
+    """Lunes de la semana de `fecha`; por defecto, la última semana con llamadas."""
+    if fecha is None:
+        return cubo['Semana'].max()
+    return ag.inicio_semana(pd.Series([pd.Timestamp(fecha)]))[0]
+
+
+def armar_trabajos(snap, salida, formatos, semana):
+    """Un trabajo por agente y por tema con llamadas en `semana`, con solo los agregados que su reporte necesita."""
+    cubo = snap["cubo_agente_tema"]
+    cubo = cubo[cubo['Semana'] == semana]
+    periodo = (semana, semana + pd.Timedelta(days=6))
+    salida = os.path.join(salida, f"{semana:%Y-%m-%d}")
+    trabajos = []
+    for tipo, columna, otra, mensuales in (
+        ("agente", "Agent", "Topic", snap["resueltas_mensuales_agente"]),
+        ("tema", "Topic", "Agent", snap["resueltas_mensuales_tema"]),
+    ):
+        for nombre, corte in cubo.groupby(columna):
+            trabajos.append({
+                "tipo": tipo,
+                "nombre": nombre,
+                "tabla": ag.resumen_cubo(corte, otra),
+                "mensual": mensuales[nombre].loc[:periodo[1]],
+                "periodo": periodo,
+                "ruta": os.path.join(salida, f"{tipo}s", _nombre_archivo(nombre)),
+                "formatos": formatos,
+            })
+    return trabajos
+
+
+# ------------------ Render (corre en los procesos del pool) ------------------
+def _iniciar_proceso():
+    matplotlib.use("Agg")
+    aplicar_estilo()
+
+
+def renderizar_reporte(trabajo):
+    tabla, mensual = trabajo["tabla"], trabajo["mensual"]
+    coef = ag.coeficientes_tendencia(mensual)
+
+    # Figure directa (sin pyplot): no queda estado global acumulado entre reportes
+    if trabajo["tipo"] == "agente":
+        fig = Figure(figsize=(10, 11))
+        ax1, ax2 = fig.subplots(2, 1)
+        barras_atendidas_resueltas(ax1, tabla, 'Topic', 'Atendidas vs Resueltas por Tema')
+        linea_tendencia_mensual(ax2, mensual, coef, 'Tendencia de llamadas resueltas')
+    else:
+        fig = Figure(figsize=(10, 15))
+        ax1, ax2, ax3 = fig.subplots(3, 1)
+        por_satisfaccion = tabla.sort_values('Satisfacción', ascending=False)
+        barras_por_categoria(ax1, por_satisfaccion['Agent'], por_satisfaccion['Satisfacción'],
+                             'Promedio de satisfacción por Agente', PALETTE["accent"])
+        por_no_atendidas = tabla.sort_values('No_Atendidas', ascending=False)
+        barras_por_categoria(ax2, por_no_atendidas['Agent'], por_no_atendidas['No_Atendidas'],
+                             'Llamadas no atendidas por Agente', PALETTE["text"], formato="{:.0f}")
+        linea_tendencia_mensual(ax3, mensual, coef, 'Tendencia de llamadas resueltas')
+
+    inicio, fin = trabajo["periodo"]
+    fig.suptitle(f"{trabajo['nombre']} · semana del {inicio:%Y-%m-%d} al {fin:%Y-%m-%d}",
+                 color=PALETTE["text"], fontweight="bold")
+    fig.tight_layout(rect=(0, 0, 1, 0.97))
+
+    os.makedirs(os.path.dirname(trabajo["ruta"]), exist_ok=True)
+    archivos = []
+    for formato in trabajo["formatos"]:
+        archivo = f"{trabajo['ruta']}.{formato}"
+        fig.savefig(archivo, format=formato)
+        archivos.append(archivo)
+    return archivos
+
+
+# ------------------ CLI ------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exporta reportes por agente y por tema.")
+    parser.add_argument("--semana", type=date.fromisoformat, default=None,
+                        help="Cualquier fecha (AAAA-MM-DD) de la semana a reportar (por defecto: la última con llamadas)")
+    parser.add_argument("--salida", default="reportes",
+                        help="Directorio de salida; cada semana va en su subdirectorio (por defecto: %(default)s)")
+    parser.add_argument("--formatos", nargs="+", choices=FORMATOS, default=["png"],
+                        help="Formatos a generar (por defecto: png)")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count(),
+                        help="Procesos del pool (por defecto: uno por CPU)")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    snap = obtener_snapshot()
+    semana = semana_del_reporte(snap["cubo_agente_tema"], args.semana)
+    trabajos = armar_trabajos(snap, args.salida, args.formatos, semana)
+    total = len(trabajos)
+    if not total:
+        print(f"Sin llamadas en la semana del {semana:%Y-%m-%d}")
+        return
+
+    with ProcessPoolExecutor(max_workers=args.procesos, initializer=_iniciar_proceso) as pool:
+        futuros = {pool.submit(renderizar_reporte, t): t for t in trabajos}
+        for i, futuro in enumerate(as_completed(futuros), 1):
+            trabajo = futuros[futuro]
+            archivos = futuro.result()
+            print(f"[{i}/{total}] {trabajo['tipo']} {trabajo['nombre']}: {', '.join(archivos)}", flush=True)
+
+    duracion = time.perf_counter() - inicio
+    print(f"{total} reportes en {duracion:.2f} s ({total / duracion:.1f} reportes/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+import functools
+
+import numpy as np
+
+from agregados import evaluar_tendencia
+
+# matplotlib no se importa aquí: tarda en cargar y solo hace falta cuando se
+# dibuja el primer gráfico en el servidor (ver `figura`).
+
+# ------------------ Paleta minimalista ------------------
+PALETTE = {
+    "bg": "#FFFFFF",
+    "text": "#2B2D42",      # dark slate
+    "muted": "#7D8A99",    # gray
+    "accent": "#D6457B",   # soft muted pink accent
+    "card_bg": "#F8F9FB"   # very light gray card background
+}
+
+
+def aplicar_estilo():
+    import matplotlib
+
+    matplotlib.rcParams.update({
+        "figure.facecolor": PALETTE["bg"],
+        "axes.facecolor": PALETTE["bg"],
+        "axes.edgecolor": PALETTE["muted"],
+        "axes.titleweight": "bold",
+        "axes.titlesize": 12,
+        "axes.labelcolor": PALETTE["text"],
+        "xtick.color": PALETTE["muted"],
+        "ytick.color": PALETTE["muted"],
+        "font.size": 10,
+    })
+
+
+@functools.cache
+def _pyplot():
+    import matplotlib.pyplot as plt
+
+    aplicar_estilo()
+    return plt
+
+
+def figura(figsize):
+    """Equivale a `plt.subplots(figsize=...)`, importando y configurando matplotlib la primera vez."""
+    return _pyplot().subplots(figsize=figsize)
+
+
+# ------------------ Gráficos compartidos por páginas y reportes ------------------
+def dona_por_tema(ax, calls_por_topic):
+    """Dona de llamadas por tema con la paleta propia.
+
+    Si la tabla trae la columna `± %` (vista previa), cada porcentaje con margen muestra su intervalo.
+    """
+    # `autopct` se llama una vez por porción, en el orden de las filas
+    margenes = iter(calls_por_topic['± %']) if '± %' in calls_por_topic else None
+
+    def etiqueta(pct):
+        margen = next(margenes) if margenes is not None else None
+        if pct <= 4:
+            return ""
+        return f"{pct:.1f} ± {margen:.1f}%" if margen else f"{pct:.1f}%"
+
+    wedges, texts, autotexts = ax.pie(
+        calls_por_topic['Count'],
+        labels=calls_por_topic['Topic'],
+        autopct=etiqueta,
+        startangle=90,
+        pctdistance=0.75,
+        labeldistance=1.05,
+        colors=[PALETTE["accent"]] * len(calls_por_topic),  # MISMO COLOR DE LA PALETA
+        wedgeprops={"width": 0.5, "edgecolor": PALETTE["bg"]}
+    )
+
+    # Colores de textos dentro de la paleta
+    for t in texts:
+        t.set_color(PALETTE["text"])
+        t.set_fontsize(9)
+    for at in autotexts:
+        at.set_color(PALETTE["text"])
+        at.set_fontweight("bold")
+
+    ax.set(aspect="equal")
+    ax.set_title("Llamadas por Tema", color=PALETTE["text"], pad=12)
+
+
+def linea_atendidas_diarias(ax, serie):
+    """Tendencia diaria suavizada con relleno sutil y fechas en el eje X."""
+    import matplotlib.dates as mdates
+
+    # Línea principal
+    ax.plot(serie.index, serie.values, linewidth=2.2, color=PALETTE["accent"])
+
+    # Relleno sutil
+    ax.fill_between(serie.index, serie.values, alpha=0.08, color=PALETTE["accent"])
+
+    ax.set_title("Llamadas atendidas por fecha", color=PALETTE["text"], pad=14)
+    ax.grid(False)
+    ax.set_ylabel("")
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['left'].set_visible(False)
+    ax.spines['bottom'].set_color(PALETTE["muted"])
+
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+    for label in ax.get_xticklabels():
+        label.set(rotation=30, ha='right', color=PALETTE["muted"])
+
+
+def barras_atendidas_resueltas(ax, tabla, etiqueta, titulo):
+    """Barras agrupadas Atendidas vs Resueltas, una pareja por fila de `tabla`."""
+    x = np.arange(len(tabla))
+    width = 0.35
+
+    # Barras
+    bars1 = ax.bar(x - width/2, tabla['Atendidas'], width=width, label='Atendidas', color=PALETTE["accent"])
+    bars2 = ax.bar(x + width/2, tabla['Resueltas'], width=width, label='Resueltas', color=PALETTE["text"])
+
+    # Etiquetas de valores sobre las barras
+    for bar in [*bars1, *bars2]:
+        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height(), int(bar.get_height()),
+                ha='center', va='bottom', fontsize=9, color=PALETTE["text"])
+
+    # Eliminar fondo, bordes y líneas de grilla
+    ax.set_facecolor(PALETTE["bg"])
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    ax.grid(False)
+
+    # Eje X
+    ax.set_xticks(x)
+    ax.set_xticklabels(tabla[etiqueta], rotation=45, ha='right', color=PALETTE["text"])
+
+    ax.set_ylabel("")
+    ax.set_title(titulo, color=PALETTE["text"], pad=10)
+
+    # Leyenda centrada
+    ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.15), ncol=2, frameon=False)
+
+
+def linea_tendencia_mensual(ax, serie, coef, titulo):
+    """Serie mensual con etiquetas de datos y, si hay coeficientes, su recta de tendencia."""
+    ax.plot(serie.index, serie.values, marker='o', linewidth=2,
+            label='Resueltas', color=PALETTE["accent"])
+    if coef is not None:
+        ax.plot(serie.index, evaluar_tendencia(coef, serie.index), linestyle='--',
+                linewidth=1.8, label='Tendencia', color=PALETTE["text"])
+
+    # Etiquetas de datos sobre los puntos
+    for x_val, y_val in zip(serie.index, serie.values):
+        ax.text(x_val, y_val, f"{int(y_val)}", ha='center', va='bottom', fontsize=8, color=PALETTE["text"])
+
+    # Estilo visual minimalista
+    ax.set_facecolor(PALETTE["bg"])
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    ax.grid(False)
+
+    ax.set_title(titulo, fontsize=12, color=PALETTE["text"])
+    ax.set_xlabel('')
+    ax.set_ylabel('')
+    ax.tick_params(axis='both', colors=PALETTE["muted"])
+
+    # Leyenda centrada debajo
+    ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.12), ncol=2, frameon=False)
+
+
+def barras_por_categoria(ax, categorias, valores, titulo, color, formato="{:.2f}"):
+    """Barras simples con el valor sobre cada barra."""
+    bars = ax.bar(categorias, valores, color=color)
+
+    for bar in bars:
+        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height(),
+                formato.format(bar.get_height()), ha='center', va='bottom',
+                fontsize=9, color=PALETTE["text"])
+
+    for spine in ax.spines.values(): spine.set_visible(False)
+    ax.set_xticks(range(len(categorias)))
+    ax.set_xticklabels(categorias, rotation=45, ha='right', color=PALETTE["text"])
+    ax.set_title(titulo, color=PALETTE["text"])
+    ax.grid(False)
+
+
+# ------------------ Small multiples (se dibujan en el navegador) ------------------
+def spec_multiples(matriz, titulo, columnas=4):
+    """Datos en formato largo y spec Vega-Lite con un panel por columna de `matriz`.
+
+    Todas las series van en un único gráfico facetado con ejes compartidos: un
+    solo render en el cliente en lugar de una figura de matplotlib por serie.
+    """
+    datos = matriz.rename_axis(index="Fecha", columns="Grupo").stack().rename("Llamadas").reset_index()
+    spec = {
+        "title": {"text": titulo, "color": PALETTE["text"], "fontSize": 14},
+        "facet": {
+            "field": "Grupo", "type": "nominal", "title": None,
+            "header": {"labelColor": PALETTE["text"], "labelFontWeight": "bold", "labelFontSize": 11},
+        },
+        "columns": columnas,
+        "spec": {
+            "width": 230,
+            "height": 110,
+            "mark": {"type": "line", "color": PALETTE["accent"], "strokeWidth": 1.8},
+            "encoding": {
+                "x": {"field": "Fecha", "type": "temporal", "title": None},
+                "y": {"field": "Llamadas", "type": "quantitative", "title": None},
+                "tooltip": [
+                    {"field": "Grupo", "type": "nominal"},
+                    {"field": "Fecha", "type": "temporal"},
+                    {"field": "Llamadas", "type": "quantitative", "format": ".1f"},
+                ],
+            },
+        },
+        "resolve": {"scale": {"x": "shared", "y": "shared"}},
+        "config": {
+            "view": {"stroke": None},
+            "axis": {"grid": False, "labelColor": PALETTE["muted"], "domainColor": PALETTE["muted"],
+                     "tickColor": PALETTE["muted"]},
+        },
+    }
+    return datos, spec
@@ -0,0 +1,267 @@
+"""Vista previa aproximada sobre una muestra estratificada.
+
+Con historiales muy grandes, mientras el snapshot exacto se calcula en segundo
+plano las páginas se dibujan con estimaciones hechas sobre una muestra
+estratificada por fecha y tema, con intervalos de confianza del 95 %. Al
+terminar el cálculo exacto la página se vuelve a ejecutar sola.
+"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import agregados as ag
+from precarga import programador
+from snapshot import leer_snapshot
+
+# ------------------ Parámetros ------------------
+TAM_MUESTRA = 20_000
+# Por debajo de este tamaño el cálculo exacto ya es inmediato: no hay vista previa
+UMBRAL_VISTA_PREVIA = 200_000
+ESTRATOS = ["Date", "Topic"]
+Z_95 = 1.96
+
+
+# ------------------ Muestra estratificada ------------------
+def muestra_estratificada(df, tam=TAM_MUESTRA, semilla=0):
+    """Muestra aleatoria sin reemplazo con asignación proporcional por (fecha, tema).
+
+    Cada estrato aporta al menos dos filas (o todas las que tenga) para poder
+    estimar su varianza. Agrega las columnas `_estrato`, `_N` y `_n`.
+    """
+    estrato = df.groupby(ESTRATOS, sort=False, dropna=False).ngroup().to_numpy()
+    N_h = np.bincount(estrato)
+    fraccion = min(1.0, tam / len(df))
+    n_h = np.minimum(N_h, np.maximum(2, np.round(N_h * fraccion).astype(np.int64)))
+
+    # Orden aleatorio dentro de cada estrato (clave = estrato + U[0, 1)) y nos quedamos con los n_h primeros
+    rng = np.random.default_rng(semilla)
+    orden = np.argsort(estrato + rng.random(len(df)))
+    inicios = np.concatenate(([0], np.cumsum(N_h)[:-1]))
+    posicion = np.arange(len(df)) - inicios[estrato[orden]]
+    filas = np.sort(orden[posicion < n_h[estrato[orden]]])
+
+    muestra = df.iloc[filas].copy()
+    muestra["_estrato"] = estrato[filas]
+    muestra["_N"] = N_h[muestra["_estrato"]]
+    muestra["_n"] = n_h[muestra["_estrato"]]
+    return muestra
+
+
+# ------------------ Estimadores ------------------
+def _total(muestra, y, por=None):
+    """Total estimado de `y` (por grupo si se indica `por`) y su error estándar.
+
+    Estimador estratificado clásico: suma sobre estratos de N_h·ȳ_h, con varianza
+    N_h²·(1 - n_h/N_h)·s_h²/n_h. Las filas fuera del grupo cuentan como y = 0.
+    """
+    y = np.asarray(y, dtype=float)
+    estrato = muestra["_estrato"].to_numpy()
+    if por is None:
+        grupo, grupos = np.zeros(len(muestra), dtype=np.intp), None
+    else:
+        grupo, grupos = pd.factorize(muestra[por], use_na_sentinel=False)
+
+    # Sumas por celda (estrato, grupo) con bincount: la muestra es chica y esto evita un groupby por llamada
+    celdas, celda = np.unique(estrato * (grupo.max() + 1) + grupo, return_inverse=True)
+    suma_y = np.bincount(celda, weights=y)
+    suma_y2 = np.bincount(celda, weights=y * y)
+    primera = np.zeros(len(celdas), dtype=np.intp)
+    primera[celda] = np.arange(len(celda))
+    N = muestra["_N"].to_numpy()[primera].astype(float)
+    n = muestra["_n"].to_numpy()[primera].astype(float)
+
+    media = suma_y / n
+    var_h = np.where(n > 1, (suma_y2 - n * media ** 2) / np.maximum(n - 1, 1), 0).clip(min=0)
+    total_h = N * media
+    var_total_h = N ** 2 * (1 - n / N) * var_h / n
+    if por is None:
+        return float(total_h.sum()), float(np.sqrt(var_total_h.sum()))
+    grupo_celda = grupo[primera]
+    total = pd.Series(np.bincount(grupo_celda, weights=total_h, minlength=len(grupos)), index=grupos)
+    var = pd.Series(np.bincount(grupo_celda, weights=var_total_h, minlength=len(grupos)), index=grupos)
+    return total.rename_axis(por).sort_index(), np.sqrt(var.rename_axis(por).sort_index())
+
+
+def _razon(muestra, num, den, por=None):
+    """Razón estimada Σnum/Σden y su error estándar (linealización de Taylor)."""
+    num = np.asarray(num, dtype=float)
+    den = np.asarray(den, dtype=float)
+    t_num, _ = _total(muestra, num, por)
+    t_den, _ = _total(muestra, den, por)
+    razon = t_num / t_den
+    if por is None:
+        _, se = _total(muestra, num - razon * den)
+        return razon, se / t_den
+    residuo = num - muestra[por].map(razon).to_numpy(dtype=float) * den
+    _, se = _total(muestra, residuo, por)
+    return razon, se / t_den
+
+
+def _entero(serie):
+    return serie.round().astype(int)
+
+
+def _atendidas_diarias_por(muestra, atendida, columna, grupos):
+    """Matriz día × grupo estimada con los pesos N_h/n_h (solo estimación puntual)."""
+    peso = muestra["_N"] / muestra["_n"] * atendida
+    return (
+        muestra.assign(_peso=peso).groupby(["Date", columna])["_peso"].sum()
+        .unstack(fill_value=0)
+        .reindex(columns=grupos, fill_value=0)
+        .sort_index()
+        .asfreq("D", fill_value=0)
+    )
+
+
+# ------------------ Vista previa ------------------
+def vista_previa(df, tam=TAM_MUESTRA, semilla=0):
+    """Versión aproximada del snapshot con las mismas claves que usan las páginas.
+
+    `ic` guarda la semiamplitud del intervalo del 95 % de los KPIs y las tablas
+    por agente incluyen columnas `± ...` con la de cada conteo.
+    """
+    m = muestra_estratificada(df, tam, semilla)
+    N = len(df)
+    uno = np.ones(len(m))
+    atendida = m["Answered"].eq("Y").to_numpy(dtype=float)
+    resuelta = m["Resolved"].eq("Y").to_numpy(dtype=float)
+    speed = m["Speed of answer in seconds"].to_numpy(dtype=float)
+    satisf = m["Satisfaction rating"].to_numpy(dtype=float)
+    m_peso = m.assign(_peso=m["_N"] / m["_n"])
+
+    # KPIs
+    resueltas, se_resueltas = _total(m, resuelta)
+    prom_speed, se_speed = _razon(m, speed * resuelta, resuelta)
+    prom_satisf, se_satisf = _razon(m, satisf, uno)
+    kpis = {
+        "total_llamadas": N,
+        "Q_agentes": int(df["Agent"].nunique()),
+        "resueltas": int(round(resueltas)),
+        "pct_resueltas": round(resueltas / N * 100, 2),
+        "R_porSegundo_resueltas": round(prom_speed, 2) if resueltas else 0,
+        "satisfaccion": round(prom_satisf, 2),
+    }
+    ic = {
+        "resueltas": int(round(Z_95 * se_resueltas)),
+        "pct_resueltas": round(Z_95 * se_resueltas / N * 100, 2),
+        "R_porSegundo_resueltas": round(Z_95 * se_speed, 2),
+        "satisfaccion": round(Z_95 * se_satisf, 2),
+    }
+
+    # Llamadas por tema (participación con su intervalo)
+    por_tema, se_tema = _total(m, uno, "Topic")
+    llamadas_por_tema = pd.DataFrame({
+        "Topic": por_tema.index,
+        "Count": _entero(por_tema).to_numpy(),
+        "± %": (Z_95 * se_tema / N * 100).round(2).to_numpy(),
+    }).sort_values("Count", ascending=False, ignore_index=True)
+
+    # Resumen por día de la semana
+    dia = m["Date"].dt.day_name()
+    m_dia = m.assign(DayOfWeek=dia)
+    resumen = pd.DataFrame({
+        "Llamadas": _total(m_dia, uno, "DayOfWeek")[0],
+        "Atendidas": _total(m_dia, atendida, "DayOfWeek")[0],
+        "Resueltas": _total(m_dia, resuelta, "DayOfWeek")[0],
+    }).reindex(ag.DIAS_ORDEN).dropna().round().astype(int)
+    resumen.insert(0, "Día", resumen.index.map(ag.DIAS_ES))
+
+    # Series
+    atendidas_dia = _total(m, atendida, "Date")[0].sort_index()
+    resueltas_dia = _total(m, resuelta, "Date")[0].sort_index()
+    resueltas_mensuales = _entero(resueltas_dia.resample("MS").sum())
+
+    # Agentes (conteos con su intervalo)
+    columnas_agente = {}
+    for nombre, y in (("Total_Llamadas", uno), ("Atendidas", atendida), ("Resueltas", resuelta)):
+        total, se = _total(m, y, "Agent")
+        columnas_agente[nombre] = _entero(total)
+        columnas_agente[f"± {nombre}"] = _entero(Z_95 * se)
+    tabla_agentes = pd.DataFrame(columnas_agente).rename_axis("Agent").reset_index()
+    tabla_agentes.insert(4, "No_Resueltas", tabla_agentes["Atendidas"] - tabla_agentes["Resueltas"])
+    tabla_agentes = tabla_agentes[[
+        "Agent", "Total_Llamadas", "Atendidas", "Resueltas", "No_Resueltas",
+        "± Total_Llamadas", "± Atendidas", "± Resueltas",
+    ]]
+
+    # Temas
+    satisf_tema, _ = _razon(m, satisf, uno, "Topic")
+    speed_tema, _ = _razon(m, speed, uno, "Topic")
+    resueltas_tema = _entero(_total(m, resuelta, "Topic")[0])
+    no_atendidas_tema = _entero(_total(m, 1 - atendida, "Topic")[0])
+    total_tema = _entero(por_tema)
+
+    tabla_temas = pd.DataFrame({"Total": total_tema, "Resueltas": resueltas_tema})
+    tabla_temas["No_Resueltas"] = tabla_temas["Total"] - tabla_temas["Resueltas"]
+    tabla_temas["% Resueltas"] = (tabla_temas["Resueltas"] / tabla_temas["Total"] * 100).round(1)
+
+    kpis_por_tema = pd.DataFrame({
+        "Prom_Satisfacción": satisf_tema.round(2),
+        "Prom_Speed": speed_tema.round(1),
+        "Llamadas": total_tema,
+    }).rename_axis("Topic").reset_index().sort_values("Llamadas", ascending=False)
+
+    return {
+        "version": None,
+        "aproximado": True,
+        "generado": datetime.now().isoformat(timespec="seconds"),
+        "descripcion": f"vista previa sobre {len(m):,} de {N:,} llamadas",
+        "ic": ic,
+        "kpis": kpis,
+        "llamadas_por_tema": llamadas_por_tema,
+        "resumen_semanal": resumen.reset_index(drop=True),
+        "atendidas_diarias": atendidas_dia.rolling(window=ag.VENTANA_SUAVIZADO, min_periods=1, center=True).mean(),
+        "tabla_agentes": tabla_agentes,
+        "atendidas_diarias_agente": _atendidas_diarias_por(m, atendida, "Agent", sorted(df["Agent"].dropna().unique())),
+        "resueltas_mensuales": resueltas_mensuales,
+        "tendencia_resueltas": ag.coeficientes_tendencia(resueltas_mensuales),
+        "satisfaccion_por_tema": (
+            satisf_tema.rename("Satisfaction rating").rename_axis("Topic").reset_index()
+            .sort_values("Satisfaction rating", ascending=False)
+        ),
+        "tabla_temas": tabla_temas.rename_axis("Topic").reset_index(),
+        "kpis_por_tema": kpis_por_tema,
+        "no_atendidas_por_tema": (
+            no_atendidas_tema[no_atendidas_tema > 0].rename("No_Atendidas").rename_axis("Topic").reset_index()
+            .sort_values("No_Atendidas", ascending=False)
+        ),
+        "atendidas_diarias_tema": _atendidas_diarias_por(m, atendida, "Topic", sorted(df["Topic"].dropna().unique())),
+        "llegadas_por_intervalo": ag.llegadas_por_intervalo(m_peso, peso="_peso"),
+        "aht_segundos": ag.duracion_media(m_peso, peso="_peso"),
+    }
+
+
+# ------------------ Integración con las páginas ------------------
+def snapshot_o_vista_previa():
+    """El snapshot exacto si ya existe; si no, una vista previa mientras se calcula en segundo plano."""
+    snap = leer_snapshot()
+    if snap is not None:
+        return snap
+    df = programador.obtener("llamadas")
+    if len(df) <= UMBRAL_VISTA_PREVIA:
+        return programador.obtener("snapshot")
+    programador.programar("snapshot")
+    return programador.obtener("vista_previa")
+
+
+def con_ic(snap, clave, texto, sufijo=""):
+    """Texto de una tarjeta KPI, con su intervalo si el valor es aproximado."""
+    if snap.get("aproximado") and clave in snap["ic"]:
+        return f"{texto} ± {snap['ic'][clave]}{sufijo}"
+    return texto
+
+
+@st.fragment(run_every=1)
+def _esperar_exacto():
+    if leer_snapshot() is not None:
+        st.rerun()
+
+
+def avisar_vista_previa(snap):
+    """Aviso de valores aproximados; la página se refresca sola cuando llega el cálculo exacto."""
+    if not snap.get("aproximado"):
+        return
+    st.info(f"⏳ Valores aproximados ({snap['descripcion']}, IC 95 %). Calculando los valores exactos...")
+    _esperar_exacto()
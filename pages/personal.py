@@ -0,0 +1,112 @@
+import numpy as np
+import streamlit as st
+
+from agregados import DIAS_ES, DIAS_ORDEN, INTERVALO_MINUTOS
+from arranque import iniciar_pagina, mostrar_tarjetas, precargar_otras
+from erlang import agentes_necesarios
+from graficos import PALETTE
+from muestreo import avisar_vista_previa, snapshot_o_vista_previa
+
+AHT_MINIMO = 1.0
+AHT_MAXIMO = 4 * 3600.0
+
+# ------------------ Configuración, menú y título ------------------
+iniciar_pagina("🧮 Dimensionamiento")
+
+# ------------------ Snapshot precalculado (o vista previa aproximada) ------------------
+snap = snapshot_o_vista_previa()
+st.caption(f"Datos al {snap['generado']}")
+avisar_vista_previa(snap)
+
+# ------------------ Parámetros ------------------
+p1, p2, p3 = st.columns(3)
+sl_objetivo = p1.slider("🎯 Nivel de servicio objetivo (%)", 50, 99, 80, step=1) / 100
+tiempo_objetivo = p2.number_input("⏱️ Atender antes de (s)", min_value=1, max_value=600, value=20, step=5)
+# El valor por defecto sale de los datos: se acota al rango del control para que no falle
+aht_datos = min(max(round(float(snap["aht_segundos"]) or 180.0, 1), AHT_MINIMO), AHT_MAXIMO)
+aht = p3.number_input("🗣️ Duración media (AHT, s)", min_value=AHT_MINIMO, max_value=AHT_MAXIMO,
+                      value=aht_datos, step=5.0,
+                      help="Por defecto, el promedio de AvgTalkDuration de las llamadas atendidas")
+
+# ------------------ Erlang C sobre toda la semana tipo ------------------
+llegadas = snap["llegadas_por_intervalo"].copy()
+segundos_intervalo = INTERVALO_MINUTOS * 60
+# Tráfico ofrecido en Erlangs: llamadas del intervalo × AHT / duración del intervalo
+llegadas['Erlangs'] = llegadas['Llamadas'] * aht / segundos_intervalo
+agentes, sl, asa, alcanzado = agentes_necesarios(llegadas['Erlangs'].to_numpy(), aht, sl_objetivo, tiempo_objetivo)
+llegadas['Agentes'] = agentes
+llegadas['Alcanza_Objetivo'] = np.where(alcanzado, "Sí", "No")
+llegadas['Nivel_Servicio'] = (sl * 100).round(1)
+llegadas['ASA'] = np.round(asa, 1)
+
+dias = [DIAS_ES[d] for d in DIAS_ORDEN]
+llegadas['Día'] = llegadas['Dia'].map(dict(enumerate(dias)))
+minuto = llegadas['Franja'].astype(int) * INTERVALO_MINUTOS
+llegadas['Hora'] = (minuto // 60).map('{:02d}'.format) + ':' + (minuto % 60).map('{:02d}'.format)
+
+# Franjas en las que ni el máximo de la grilla llega al objetivo: se avisan, no se dan por cubiertas
+sin_cubrir = int((~alcanzado).sum())
+if sin_cubrir:
+    st.warning(f"⚠️ {sin_cubrir} franjas no llegan al objetivo ni con {int(llegadas.loc[~alcanzado, 'Agentes'].max())} "
+               "agentes: se muestran con ese máximo y su nivel de servicio real (ver \"Alcanza objetivo\").")
+
+# ------------------ Métricas ------------------
+horas_agente = float((llegadas['Agentes'] * segundos_intervalo).sum() / 3600)
+mostrar_tarjetas([
+    ("📞 Llamadas / semana", f"{llegadas['Llamadas'].sum():,.0f}"),
+    ("👩‍💻 Pico de agentes", f"{int(llegadas['Agentes'].max())}"),
+    ("🕒 Horas-agente / semana", f"{horas_agente:,.1f}"),
+])
+
+# ------------------ Mapa de calor: agentes necesarios por franja ------------------
+con_trafico = llegadas[llegadas['Llamadas'] > 0]
+franjas = con_trafico['Hora'].sort_values().unique().tolist()
+st.vega_lite_chart(
+    llegadas[llegadas['Hora'].isin(franjas)][['Día', 'Hora', 'Agentes', 'Llamadas', 'Nivel_Servicio', 'ASA', 'Alcanza_Objetivo']],
+    {
+        "title": {"text": "Agentes necesarios por franja", "color": PALETTE["text"], "fontSize": 14},
+        "mark": {"type": "rect"},
+        "encoding": {
+            "x": {"field": "Hora", "type": "ordinal", "sort": franjas, "title": None},
+            "y": {"field": "Día", "type": "ordinal", "sort": dias, "title": None},
+            "color": {"field": "Agentes", "type": "quantitative",
+                      "scale": {"range": [PALETTE["card_bg"], PALETTE["accent"]]}},
+            "tooltip": [
+                {"field": "Día"}, {"field": "Hora"},
+                {"field": "Llamadas", "type": "quantitative", "format": ".2f"},
+                {"field": "Agentes", "type": "quantitative"},
+                {"field": "Nivel_Servicio", "type": "quantitative", "title": "Nivel de servicio (%)"},
+                {"field": "Alcanza_Objetivo", "title": "Alcanza objetivo"},
+                {"field": "ASA", "type": "quantitative", "title": "ASA (s)"},
+            ],
+        },
+        "config": {"view": {"stroke": None},
+                   "axis": {"labelColor": PALETTE["muted"], "domainColor": PALETTE["muted"]}},
+    },
+    use_container_width=True,
+)
+
+# ------------------ Resumen por día ------------------
+resumen = (
+    llegadas.groupby('Dia')
+    .agg(
+        Llamadas=('Llamadas', 'sum'),
+        Pico_Agentes=('Agentes', 'max'),
+        Horas_Agente=('Agentes', lambda x: x.sum() * segundos_intervalo / 3600),
+    )
+    .reset_index()
+)
+resumen.insert(0, 'Día', resumen.pop('Dia').map(dict(enumerate(dias))))
+resumen['Llamadas'] = resumen['Llamadas'].round(1)
+resumen['Horas_Agente'] = resumen['Horas_Agente'].round(1)
+
+st.dataframe(
+    resumen.style.set_properties(
+        **{'background-color': PALETTE["card_bg"], 'color': PALETTE["text"]}
+    ),
+    use_container_width=True,
+    hide_index=True
+)
+
+# ------------------ Precarga de las otras páginas (después de dibujar esta) ------------------
+precargar_otras("Personal")
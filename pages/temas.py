@@ -1,183 +1,21 @@
-import pandas as pd
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mtick
-import matplotlib.dates as mdates
 
-# ------------------ Configuración de la página ------------------
-st.set_page_config(
-    page_title="Call center",
-    page_icon="📞",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+from agregados import periodo_multiples
+from arranque import iniciar_pagina, precargar_otras, tarjetas_kpi
+from detalle import fila_seleccionada, mostrar_detalle
+from graficos import PALETTE, barras_por_categoria, figura, spec_multiples
+from muestreo import avisar_vista_previa, snapshot_o_vista_previa
 
-# ------- Sidebar Title -------
+# ------------------ Configuración, menú y título ------------------
+iniciar_pagina("⭐ Temas")
 
-# ------- Ocultar menú lateral predeterminado -------
-hide_default_sidebar = """
-    <style>
-        /* Oculta la navegación de páginas automática */
-        [data-testid="stSidebarNav"] {
-            display: none !important;
-        }
-
-        /* También oculta el contenedor del título predeterminado */
-        [data-testid="stSidebarNavItems"] {
-            display: none !important;
-        }
-
-        /* Asegura que tu propio menú quede arriba sin espacios vacíos */
-        section[data-testid="stSidebar"] div:nth-child(1) {
-            padding-top: 0 !important;
-        }
-    </style>
-"""
-st.markdown(hide_default_sidebar, unsafe_allow_html=True)
-
-st.sidebar.markdown("### 📞 Centro de llamadas")
-
-# ------- Opciones del menú -------
-menu = ["Llamadas", "Agentes", "Temas"]
-icons = ["📞", "👥", "📄"]
-page_files = {
-    "Llamadas": "llamadas.py",
-    "Agentes": "pages/agentes.py",
-    "Temas": "pages/temas.py" 
-}
-
-# Guardamos en la sesión la opción seleccionada
-if "selected_page" not in st.session_state:
-    st.session_state.selected_page = menu[0]
-
-# Mostrar el menú visualmente
-for i, item in enumerate(menu):
-    is_active = item == st.session_state.selected_page
-    active_class = "active" if is_active else ""
-    if st.sidebar.button(f"{icons[i]} {item}", key=item):
-        st.session_state.selected_page = item
-        st.switch_page(page_files[item])  # ⬅ Cambio de página real
-
-# ------- CSS para mejorar estilo -------
-st.markdown("""
-    <style>
-    section[data-testid="stSidebar"] {
-        background-color: #F8F9FB;
-    }
-    .active {
-        background-color: #DDE3EC;
-        border-radius: 10px;
-        font-weight: 600;
-    }
-    button[kind="secondary"] {
-        width: 100%;
-        text-align: left;
-        background-color: transparent;
-        border-radius: 10px;
-    }
-    button[kind="secondary"]:hover {
-        background-color: #E9ECEF;
-    }
-    </style>
-""", unsafe_allow_html=True)
-
-
-
-# ------------------ Paleta minimalista ------------------
-PALETTE = {
-    "bg": "#FFFFFF",
-    "text": "#2B2D42",      # dark slate
-    "muted": "#7D8A99",    # gray
-    "accent": "#D6457B",   # soft muted pink accent
-    "card_bg": "#F8F9FB"   # very light gray card background
-}
-
-plt.rcParams.update({
-    "figure.facecolor": PALETTE["bg"],
-    "axes.facecolor": PALETTE["bg"],
-    "axes.edgecolor": PALETTE["muted"],
-    "axes.titleweight": "bold",
-    "axes.titlesize": 12,
-    "axes.labelcolor": PALETTE["text"],
-    "xtick.color": PALETTE["muted"],
-    "ytick.color": PALETTE["muted"],
-    "font.size": 10,
-})
-
-# ------------------ Título ------------------
-st.title("⭐ Temas")
-
-# ------------------ Dataset ------------------
-df = pd.read_excel("Data/01 Call-Center-Dataset.xlsx")
-
-# Rellenar vacíos
-df["Speed of answer in seconds"] = df["Speed of answer in seconds"].fillna(0)
-df["AvgTalkDuration"] = df["AvgTalkDuration"].fillna(0)
-df["Satisfaction rating"] = df["Satisfaction rating"].fillna(0)
-
-# normalizar fechas
-df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-
-# ------------------ Métricas ------------------
-total_llamadas = int(df["Call Id"].count())
-Q_agentes = int(df["Agent"].nunique())
-resueltas = int((df["Resolved"] == "Y").sum())
-pct_resueltas = round((resueltas / total_llamadas) * 100, 2) if total_llamadas else 0
-R_porSegundo_resueltas = round(df.loc[df["Resolved"] == "Y", "Speed of answer in seconds"].mean(), 2) if resueltas else 0
-satisfaccion = round(df["Satisfaction rating"].mean(), 2) if not df["Satisfaction rating"].isna().all() else 0
+# ------------------ Snapshot precalculado (o vista previa aproximada) ------------------
+snap = snapshot_o_vista_previa()
+st.caption(f"Datos al {snap['generado']}")
+avisar_vista_previa(snap)
 
 # ------------------ Tarjetas personalizadas ------------------
-kcol1, kcol2, kcol3, kcol4, kcol5 = st.columns(5)
-
-card_style = """
-<div style="
-    background-color:#F8F9FB;
-    padding:15px;
-    border-radius:15px;
-    text-align:center;
-    box-shadow: 0px 2px 8px rgba(0,0,0,0.1);
-    border:2px solid #E5E7EB;
-    height:150px;
-    display:flex;
-    flex-direction:column;
-    justify-content:center;
-">
-    <h3 style="
-        color:#2B2D42; 
-        font-size:1.1rem; 
-        margin-bottom:8px; 
-        font-weight:600;
-        line-height:1.2;
-        word-wrap:break-word;
-        white-space:normal;
-    ">{}</h3>
-    <h2 style="
-        color:#D6457B; 
-        font-size:1.8rem;
-        font-weight:700; 
-        margin:0;
-        line-height:1.1;
-    ">{}</h2>
-</div>
-"""
-
-with kcol1:
-    st.markdown(card_style.format("🎫 Total Llamadas", f"{total_llamadas:,}"), unsafe_allow_html=True)
-with kcol3:
-    st.markdown(card_style.format("👩‍💻 Agentes", f"{Q_agentes}"), unsafe_allow_html=True)
-with kcol5:
-    st.markdown(card_style.format("✅ % Resueltas", f"{pct_resueltas}%"), unsafe_allow_html=True)
-
-st.markdown("---")
-
-# Normalizar columnas clave
-df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-df['Answered'] = df['Answered (Y/N)'].fillna('N').astype(str)
-df['Resolved'] = df['Resolved'].fillna('N').astype(str)
-df['Speed of answer in seconds'] = pd.to_numeric(df['Speed of answer in seconds'], errors='coerce').fillna(0)
-df['Satisfaction rating'] = pd.to_numeric(df['Satisfaction rating'], errors='coerce').fillna(0)
-
+tarjetas_kpi(snap, ["total_llamadas", "Q_agentes", "pct_resueltas"])
 
 # ========================== DISTRIBUCIÓN MEJORADA ==========================
 
@@ -186,39 +24,26 @@ c1, c2 = st.columns([55, 45])
 
 # 📊 Promedio satisfacción por tema
 with c1:
-    satisfaction_by_topic = df.groupby('Topic')['Satisfaction rating'].mean().reset_index()
-    satisfaction_by_topic = satisfaction_by_topic.sort_values('Satisfaction rating', ascending=False)
+    satisfaction_by_topic = snap["satisfaccion_por_tema"]
 
-    fig, ax = plt.subplots(figsize=(9, 4))
-    bars = ax.bar(satisfaction_by_topic['Topic'], satisfaction_by_topic['Satisfaction rating'], 
-                  color=PALETTE["accent"])
-
-    for bar in bars:
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height(), 
-                f"{bar.get_height():.2f}", ha='center', va='bottom', 
-                fontsize=9, color=PALETTE["text"])
-
-    for spine in ax.spines.values(): spine.set_visible(False)
-    ax.set_xticklabels(satisfaction_by_topic['Topic'], rotation=45, ha='right', color=PALETTE["text"])
-    ax.set_title('Promedio de satisfacción por Tema', color=PALETTE["text"])
+    fig, ax = figura(figsize=(9, 4))
+    barras_por_categoria(ax, satisfaction_by_topic['Topic'], satisfaction_by_topic['Satisfaction rating'],
+                         'Promedio de satisfacción por Tema', PALETTE["accent"])
     st.pyplot(fig)
 
 # 📋 Tabla: temas resueltos y no resueltos
 with c2:
-    topic_counts = df.groupby('Topic').agg(
-        Total=('Call Id', 'count'),
-        Resueltas=('Resolved', lambda x: (x == 'Y').sum())
-    ).reset_index()
+    topic_counts = snap["tabla_temas"]
 
-    topic_counts['No_Resueltas'] = topic_counts['Total'] - topic_counts['Resueltas']
-    topic_counts['% Resueltas'] = (topic_counts['Resueltas'] / topic_counts['Total'] * 100).round(1)
-
-    st.dataframe(
+    evento_topic_counts = st.dataframe(
         topic_counts.style.set_properties(
             **{'background-color': PALETTE["card_bg"], 'color': PALETTE["text"]}
         ),
         use_container_width=True,
-        hide_index=True
+        hide_index=True,
+        on_select=lambda: st.session_state.update(tabla_temas_ultima="tabla_temas"),
+        selection_mode="single-row",
+        key="tabla_temas"
     )
 
 # Segundo bloque: tabla KPI + gráfico (50 / 50)
@@ -226,38 +51,46 @@ c3, c4 = st.columns([50, 50])
 
 # 📋 KPI por tema
 with c3:
-    topic_kpis = df.groupby('Topic').agg(
-        Prom_Satisfacción=('Satisfaction rating', 'mean'),
-        Prom_Speed=('Speed of answer in seconds', 'mean'),
-        Llamadas=('Call Id', 'count')
-    ).reset_index().sort_values('Llamadas', ascending=False)
-
-    topic_kpis['Prom_Satisfacción'] = topic_kpis['Prom_Satisfacción'].round(2)
-    topic_kpis['Prom_Speed'] = topic_kpis['Prom_Speed'].round(1)
+    topic_kpis = snap["kpis_por_tema"]
 
-    st.dataframe(
+    evento_topic_kpis = st.dataframe(
         topic_kpis.style.set_properties(
             **{'background-color': PALETTE["card_bg"], 'color': PALETTE["text"]}
         ),
         use_container_width=True,
-        hide_index=True
+        hide_index=True,
+        on_select=lambda: st.session_state.update(tabla_temas_ultima="tabla_kpis_temas"),
+        selection_mode="single-row",
+        key="tabla_kpis_temas"
     )
 
 # 📊 Llamadas no atendidas por tema
 with c4:
-    not_answered = df[df['Answered'] != 'Y'].groupby('Topic').size().reset_index(name='No_Atendidas')
-    not_answered = not_answered.sort_values('No_Atendidas', ascending=False)
+    not_answered = snap["no_atendidas_por_tema"]
 
-    fig, ax = plt.subplots(figsize=(9, 4))
-    bars = ax.bar(not_answered['Topic'], not_answered['No_Atendidas'], color=PALETTE["text"])
+    fig, ax = figura(figsize=(9, 4))
+    barras_por_categoria(ax, not_answered['Topic'], not_answered['No_Atendidas'],
+                         'Llamadas no atendidas por Tema', PALETTE["text"], formato="{:.0f}")
+    st.pyplot(fig)
 
-    for bar in bars:
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height(), 
-                f"{int(bar.get_height())}", ha='center', va='bottom', 
-                fontsize=9, color=PALETTE["text"])
+# ================== 📈 TENDENCIA POR TEMA (small multiples) ==================
+st.markdown("---")
+periodo_tema = st.radio("Período", ["Diario", "Mensual"], horizontal=True, key="periodo_multiples_tema")
+datos_multiples, spec = spec_multiples(periodo_multiples(snap["atendidas_diarias_tema"], periodo_tema),
+                                       "Llamadas atendidas por tema")
+st.vega_lite_chart(datos_multiples, spec)
+
+# ------------------ Detalle de llamadas del tema elegido en cualquiera de las tablas ------------------
+# Manda la tabla en la que se eligió (o se quitó) una fila más recientemente: si se
+# vació, no hay detalle aunque la otra conserve una selección anterior
+selecciones = {
+    "tabla_temas": fila_seleccionada(evento_topic_counts, topic_counts, 'Topic'),
+    "tabla_kpis_temas": fila_seleccionada(evento_topic_kpis, topic_kpis, 'Topic'),
+}
+tema_detalle = selecciones.get(st.session_state.get("tabla_temas_ultima"))
+if tema_detalle is not None:
+    st.markdown("---")
+    mostrar_detalle("Topic", tema_detalle, "detalle_temas")
 
-    for spine in ax.spines.values(): spine.set_visible(False)
-    ax.set_xticklabels(not_answered['Topic'], rotation=45, ha='right', color=PALETTE["text"])
-    ax.set_title('Llamadas no atendidas por Tema', color=PALETTE["text"])
-    ax.grid(False)
-    st.pyplot(fig)
+# ------------------ Precarga de las otras páginas (después de dibujar esta) ------------------
+precargar_otras("Temas")
@@ -0,0 +1,30 @@
+"""Precálculo offline del dashboard.
+
+Carga el dataset, calcula todo lo que muestran las páginas y escribe el snapshot
+versionado que ellas leen. Pensado para correr desde cron, por ejemplo:
+
+    */30 * * * * cd /ruta/al/proyecto && python precalculo.py
+"""
+import argparse
+import time
+
+from datos import RUTA_DATASET
+from snapshot import RUTA_SNAPSHOT, SNAPSHOT_VERSION, generar_snapshot
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera el snapshot del dashboard del call center.")
+    parser.add_argument("--dataset", default=RUTA_DATASET, help="Excel de llamadas (por defecto: %(default)s)")
+    parser.add_argument("--salida", default=RUTA_SNAPSHOT, help="Archivo de snapshot (por defecto: %(default)s)")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    snapshot = generar_snapshot(args.dataset, args.salida)
+    print(
+        f"Snapshot v{SNAPSHOT_VERSION} escrito en {args.salida} "
+        f"({snapshot['kpis']['total_llamadas']:,} llamadas, {time.perf_counter() - inicio:.2f} s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
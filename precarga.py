@@ -0,0 +1,163 @@
+"""Precarga en segundo plano de los datos de las otras páginas.
+
+Mientras el usuario mira una página, un hilo de trabajo calcula y deja en caché
+lo que necesitan las demás, de modo que `st.switch_page` no pague la carga.
+El módulo se importa una sola vez por proceso, así que el programador es
+compartido por todas las sesiones: cada tarea corre una sola vez por versión
+del dataset, y si el dataset cambia lo pendiente se cancela.
+"""
+import logging
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+
+from datos import RUTA_DATASET, cargar_llamadas, huella_dataset
+from snapshot import obtener_snapshot
+
+log = logging.getLogger(__name__)
+
+# ------------------ Registro de tareas ------------------
+TAREAS = {}
+
+# Qué necesita cada página antes de dibujarse (nombres de TAREAS). El dataset completo
+# ("llamadas") y el índice del detalle ("almacen") no se precargan: leer el Excel retiene
+# el GIL y frena la sesión que se quería acelerar. El almacén se arma al abrir el primer
+# detalle y el dataset solo se lee si hace falta regenerar el snapshot.
+TAREAS_POR_PAGINA = {
+    "Llamadas": ["snapshot"],
+    "Agentes": ["snapshot"],
+    "Temas": ["snapshot"],
+    "Personal": ["snapshot"],
+}
+
+
+def tarea(nombre):
+    """Registra `funcion()` como tarea precargable bajo `nombre`."""
+    def registrar(funcion):
+        TAREAS[nombre] = funcion
+        return funcion
+    return registrar
+
+
+@tarea("llamadas")
+def _cargar_llamadas():
+    # Dataset normalizado en memoria, compartido por el snapshot, el detalle y la vista previa
+    return cargar_llamadas(RUTA_DATASET)
+
+
+@tarea("snapshot")
+def _obtener_snapshot():
+    return obtener_snapshot(cargar=lambda: programador.obtener("llamadas"))
+
+
+# Todas las tareas se registran aquí, sin depender de qué módulos importó la página
+# que atendió primero al worker. `detalle` y `muestreo` importan este módulo, por eso
+# se importan dentro de la tarea.
+@tarea("almacen")
+def _construir_almacen():
+    from detalle import AlmacenLlamadas
+
+    return AlmacenLlamadas(programador.obtener("llamadas"))
+
+
+@tarea("vista_previa")
+def _vista_previa():
+    # Una sola vista previa por versión del dataset, compartida por reruns y sesiones
+    from muestreo import vista_previa
+
+    return vista_previa(programador.obtener("llamadas"))
+
+
+def _huella_actual():
+    try:
+        return huella_dataset(RUTA_DATASET)
+    except FileNotFoundError:
+        # Despliegue solo con snapshot: no hay dataset que vigilar
+        return None
+
+
+def _fallido(futuro):
+    return futuro.done() and futuro.exception() is not None
+
+
+# ------------------ Programador ------------------
+class Programador:
+    def __init__(self, max_workers=1):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="precarga")
+        self._lock = threading.Lock()
+        self._huella = None
+        self._futuros = {}
+
+    def _sincronizar(self, huella):
+        # Llamar con el lock tomado. Si el dataset cambió, se cancela lo que sigue en
+        # cola y se olvidan los resultados (y las tareas en curso) de la versión anterior.
+        if huella == self._huella:
+            return
+        for futuro in self._futuros.values():
+            futuro.cancel()
+        self._futuros = {}
+        self._huella = huella
+
+    def _reservar(self, nombre, reintentar):
+        """Devuelve (futuro, es_nuevo) para `nombre` en la versión actual del dataset.
+
+        Una tarea que falló solo se reintenta si `reintentar`: la precarga no insiste
+        con la misma versión del dataset (p. ej. un despliegue sin el Excel), pero
+        quien necesita el resultado sí lo vuelve a intentar.
+        """
+        huella = _huella_actual()
+        with self._lock:
+            self._sincronizar(huella)
+            futuro = self._futuros.get(nombre)
+            if futuro is not None and not futuro.cancelled() and not (reintentar and _fallido(futuro)):
+                return futuro, False
+            futuro = Future()
+            self._futuros[nombre] = futuro
+            return futuro, True
+
+    def _ejecutar(self, nombre, futuro):
+        try:
+            if not futuro.set_running_or_notify_cancel():
+                return
+        except RuntimeError:
+            # Otro hilo ya la está ejecutando
+            return
+        try:
+            futuro.set_result(TAREAS[nombre]())
+        except BaseException as exc:
+            log.warning("Falló la precarga de %r: %s", nombre, exc)
+            futuro.set_exception(exc)
+
+    def programar(self, nombre):
+        """Encola `nombre` en el hilo de trabajo si nadie lo calculó ni lo pidió todavía."""
+        if nombre not in TAREAS:
+            return None
+        futuro, es_nuevo = self._reservar(nombre, reintentar=False)
+        if es_nuevo:
+            self._executor.submit(self._ejecutar, nombre, futuro)
+        return futuro
+
+    def obtener(self, nombre):
+        """Resultado de `nombre`: lo reutiliza si ya está, espera si está en curso o lo calcula aquí."""
+        while True:
+            futuro, es_nuevo = self._reservar(nombre, reintentar=True)
+            if es_nuevo:
+                self._ejecutar(nombre, futuro)
+            elif not futuro.running() and not futuro.done():
+                # Sigue en la cola del hilo: lo adelantamos en este mismo hilo
+                self._ejecutar(nombre, futuro)
+            try:
+                return futuro.result()
+            except CancelledError:
+                # El dataset cambió mientras esperábamos: recalcular con la versión nueva
+                continue
+
+    def calentar(self, pagina_actual):
+        """Programa las tareas de todas las páginas salvo la actual."""
+        for pagina, nombres in TAREAS_POR_PAGINA.items():
+            if pagina == pagina_actual:
+                continue
+            for nombre in nombres:
+                self.programar(nombre)
+
+
+programador = Programador()
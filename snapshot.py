@@ -0,0 +1,113 @@
+import functools
+import os
+import pickle
+import threading
+from datetime import datetime
+
+import agregados as ag
+from datos import RUTA_DATASET, cargar_llamadas, huella_dataset
+
+# ------------------ Snapshot versionado ------------------
+# Subir la versión cada vez que cambie el contenido o el formato del snapshot:
+# las páginas ignoran (y regeneran) snapshots de otra versión.
+SNAPSHOT_VERSION = 5
+RUTA_SNAPSHOT = f"Data/snapshot_v{SNAPSHOT_VERSION}.pkl"
+
+# Evita que varias sesiones generen el mismo snapshot a la vez
+_generando = threading.Lock()
+
+
+def calcular_snapshot(df, huella=None):
+    """Calcula todo lo que muestran las tres páginas a partir del dataset normalizado."""
+    resueltas_mensuales = ag.resueltas_mensuales(df)
+    return {
+        "version": SNAPSHOT_VERSION,
+        "generado": datetime.now().isoformat(timespec="seconds"),
+        "huella": huella,
+        "kpis": ag.calcular_kpis(df),
+        # llamadas.py
+        "llamadas_por_tema": ag.llamadas_por_tema(df),
+        "resumen_semanal": ag.resumen_semanal(df),
+        "atendidas_diarias": ag.atendidas_diarias(df),
+        # agentes.py
+        "tabla_agentes": ag.tabla_agentes(df),
+        "atendidas_diarias_agente": ag.atendidas_diarias_por(df, 'Agent'),
+        "resueltas_mensuales": resueltas_mensuales,
+        "tendencia_resueltas": ag.coeficientes_tendencia(resueltas_mensuales),
+        # temas.py
+        "satisfaccion_por_tema": ag.satisfaccion_por_tema(df),
+        "tabla_temas": ag.tabla_temas(df),
+        "kpis_por_tema": ag.kpis_por_tema(df),
+        "no_atendidas_por_tema": ag.no_atendidas_por_tema(df),
+        "atendidas_diarias_tema": ag.atendidas_diarias_por(df, 'Topic'),
+        # pages/personal.py
+        "llegadas_por_intervalo": ag.llegadas_por_intervalo(df),
+        "aht_segundos": ag.duracion_media(df),
+        # exportar_reportes.py
+        "cubo_agente_tema": ag.cubo_agente_tema(df),
+        "resueltas_mensuales_agente": ag.resueltas_mensuales_por(df, 'Agent'),
+        "resueltas_mensuales_tema": ag.resueltas_mensuales_por(df, 'Topic'),
+    }
+
+
+def escribir_snapshot(snapshot, ruta=RUTA_SNAPSHOT):
+    """Escribe el snapshot de forma atómica: los lectores nunca ven un archivo a medias."""
+    os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+    tmp = f"{ruta}.tmp-{os.getpid()}"
+    with open(tmp, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, ruta)
+
+
+def generar_snapshot(ruta_dataset=RUTA_DATASET, ruta=RUTA_SNAPSHOT, df=None):
+    """Calcula y guarda el snapshot; `df` evita releer el dataset si ya está en memoria."""
+    huella = huella_dataset(ruta_dataset)
+    snapshot = calcular_snapshot(cargar_llamadas(ruta_dataset) if df is None else df, huella)
+    escribir_snapshot(snapshot, ruta)
+    return snapshot
+
+
+@functools.lru_cache(maxsize=4)
+def _leer(ruta, mtime_ns):
+    with open(ruta, "rb") as f:
+        return pickle.load(f)
+
+
+def _huella_vigente(ruta_dataset):
+    try:
+        return huella_dataset(ruta_dataset)
+    except FileNotFoundError:
+        # Despliegue solo con snapshot: no hay dataset contra el que comparar
+        return None
+
+
+def leer_snapshot(ruta=RUTA_SNAPSHOT, ruta_dataset=RUTA_DATASET):
+    """Devuelve el snapshot guardado, o None si no existe, es de otra versión o
+    se calculó con otra versión del dataset (si el dataset está disponible)."""
+    try:
+        snapshot = _leer(ruta, os.stat(ruta).st_mtime_ns)
+    except FileNotFoundError:
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    huella = _huella_vigente(ruta_dataset)
+    if huella is not None and snapshot.get("huella") != huella:
+        return None
+    return snapshot
+
+
+def obtener_snapshot(ruta=RUTA_SNAPSHOT, ruta_dataset=RUTA_DATASET, cargar=None):
+    """Snapshot para las páginas.
+
+    Normalmente lo escribe `precalculo.py` desde cron; si todavía no existe (o es
+    de otra versión, o el dataset cambió desde que se calculó) se genera una vez
+    aquí y queda guardado para las siguientes vistas.
+    `cargar()`, si se pasa, devuelve el dataset ya normalizado.
+    """
+    snapshot = leer_snapshot(ruta, ruta_dataset)
+    if snapshot is None:
+        with _generando:
+            snapshot = leer_snapshot(ruta, ruta_dataset)
+            if snapshot is None:
+                snapshot = generar_snapshot(ruta_dataset, ruta, cargar() if cargar else None)
+    return snapshot
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from detalle import COLUMNAS, TAM_PAGINA, AlmacenLlamadas
+
+
+@pytest.fixture
+def almacen():
+    n = 2 * TAM_PAGINA + 7
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({col: np.arange(n) for col in COLUMNAS})
+    df["Topic"] = rng.choice(["Streaming", "Payment related", None], n)
+    df["Agent"] = rng.choice(["Becky", "Dan", "Diane"], n)
+    df["Date"] = pd.Timestamp("2021-01-01") + pd.to_timedelta(rng.integers(0, 60, n), unit="D")
+    df.loc[rng.choice(n, 9, replace=False), "Date"] = pd.NaT
+    return AlmacenLlamadas(df), df
+
+
+def _todas(almacen, columna, valor, orden_por, ascendente):
+    total = almacen.total(columna, valor)
+    paginas = [almacen.pagina(columna, valor, orden_por, ascendente, p) for p in range(1, total // TAM_PAGINA + 2)]
+    return pd.concat(paginas, ignore_index=True)
+
+
+@pytest.mark.parametrize("ascendente", [True, False])
+def test_vacios_al_final_en_ambos_sentidos(almacen, ascendente):
+    almacen, df = almacen
+    filas = _todas(almacen, "Agent", "Becky", "Date", ascendente)
+    grupo = df[df["Agent"] == "Becky"]
+    assert len(filas) == len(grupo)
+
+    vacias = filas["Date"].isna().to_numpy()
+    assert vacias.sum() == grupo["Date"].isna().sum()
+    assert not vacias[:len(filas) - vacias.sum()].any()
+    fechas = filas["Date"].dropna()
+    assert (fechas.is_monotonic_increasing if ascendente else fechas.is_monotonic_decreasing)
+
+
+def test_pagina_filtra_el_grupo_y_respeta_el_orden_estable(almacen):
+    almacen, df = almacen
+    filas = _todas(almacen, "Topic", "Streaming", "Call Id", False)
+    esperado = df[df["Topic"] == "Streaming"].sort_values("Call Id", ascending=False)
+    assert filas["Call Id"].tolist() == esperado["Call Id"].tolist()
+    assert almacen.total("Topic", "Streaming") == len(esperado)
+
+
+def test_valor_inexistente_no_devuelve_filas(almacen):
+    almacen, _ = almacen
+    assert almacen.total("Topic", "Otro") == 0
+    assert almacen.pagina("Topic", "Otro", "Date").empty
@@ -0,0 +1,60 @@
+import math
+
+import numpy as np
+import pytest
+
+from erlang import agentes_necesarios, log_erlang_c, nivel_servicio
+
+
+def erlang_c_recursivo(a, N):
+    """Erlang C clásico a partir de la recursión de Erlang B."""
+    if N <= a:
+        return 1.0
+    b = 1.0
+    for n in range(1, N + 1):
+        b = a * b / (n + a * b)
+    return N * b / (N - a * (1 - b))
+
+
+@pytest.mark.parametrize("trafico", [[0.0], [0.5, 3.0, 9.7], [10.0, 40.0], [250.0, 480.5]])
+def test_log_erlang_c_coincide_con_la_recursion(trafico):
+    max_agentes = 600
+    obtenido = np.exp(log_erlang_c(trafico, max_agentes))
+    esperado = np.array([[erlang_c_recursivo(a, N) for N in range(1, max_agentes + 1)] for a in trafico])
+    np.testing.assert_allclose(obtenido, esperado, rtol=0, atol=1e-12)
+
+
+def test_sin_trafico_no_hay_espera():
+    log_c = log_erlang_c([0.0], 5)
+    assert np.all(np.isneginf(log_c))
+
+
+def test_cola_inestable_siempre_espera():
+    # Con N <= a la probabilidad de esperar es 1 y el nivel de servicio 0
+    log_c = log_erlang_c([4.0], 6)
+    assert np.all(log_c[0, :4] == 0)
+    sl, asa = nivel_servicio([4.0], 180, 20, 6)
+    assert np.all(sl[0, :4] == 0)
+    assert np.all(np.isinf(asa[0, :4]))
+
+
+def test_agentes_necesarios_caso_conocido():
+    # 100 llamadas en 30 minutos con AHT de 180 s = 10 Erlangs; objetivo 80 % en 20 s
+    agentes, sl, asa, alcanzado = agentes_necesarios([10.0, 0.0], aht=180, sl_objetivo=0.8, tiempo_objetivo=20)
+    assert agentes.tolist() == [14, 0]
+    assert alcanzado.tolist() == [True, True]
+    assert sl[0] == pytest.approx(0.8884, abs=1e-4)
+    assert asa[0] == pytest.approx(7.84, abs=1e-2)
+    # Con un agente menos no se llega al objetivo
+    c = erlang_c_recursivo(10.0, 13)
+    assert 1 - c * math.exp(-(13 - 10) * 20 / 180) < 0.8
+    assert (sl[1], asa[1]) == (1.0, 0.0)
+
+
+def test_objetivo_inalcanzable_en_la_grilla_se_marca():
+    # Con 12 agentes como tope, 10 Erlangs no llegan al 80 % en 20 s
+    agentes, sl, _, alcanzado = agentes_necesarios([10.0, 2.0], aht=180, sl_objetivo=0.8,
+                                                   tiempo_objetivo=20, max_agentes=12)
+    assert alcanzado.tolist() == [False, True]
+    assert agentes[0] == 12
+    assert sl[0] < 0.8 <= sl[1]
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import agregados as ag
+from datos import RUTA_DATASET, cargar_llamadas
+from muestreo import vista_previa
+from snapshot import calcular_snapshot
+
+SEMILLAS = range(40)
+
+
+@pytest.fixture(scope="module")
+def llamadas():
+    return cargar_llamadas(RUTA_DATASET)
+
+
+@pytest.fixture(scope="module")
+def replicado(llamadas):
+    # Mismo historial cuatro veces: población conocida, bastante más grande que la muestra
+    return pd.concat([llamadas] * 4, ignore_index=True)
+
+
+def _normalizar(valor):
+    """Quita las columnas de intervalo y lo que depende del desempate al ordenar."""
+    if isinstance(valor, pd.DataFrame):
+        valor = valor[[c for c in valor.columns if not str(c).startswith("±")]]
+        valor = valor.astype({c: object for c in valor.columns if isinstance(valor[c].dtype, pd.CategoricalDtype)})
+        return valor.sort_values(list(valor.columns)).reset_index(drop=True)
+    return valor
+
+
+def test_muestra_completa_reproduce_el_snapshot(llamadas):
+    exacto = calcular_snapshot(llamadas)
+    previa = vista_previa(llamadas, tam=len(llamadas))
+
+    assert all(v == 0 for v in previa["ic"].values())
+    assert (previa["tabla_agentes"].filter(like="±") == 0).all().all()
+    assert (previa["llamadas_por_tema"]["± %"] == 0).all()
+
+    claves = set(previa) - {"version", "aproximado", "generado", "descripcion", "ic"}
+    assert claves <= set(exacto)
+    for clave in sorted(claves):
+        esperado, obtenido = _normalizar(exacto[clave]), _normalizar(previa[clave])
+        if isinstance(esperado, pd.DataFrame):
+            pd.testing.assert_frame_equal(obtenido, esperado, check_dtype=False, check_index_type=False,
+                                          rtol=1e-12, obj=clave)
+        elif isinstance(esperado, pd.Series):
+            pd.testing.assert_series_equal(obtenido, esperado, check_dtype=False, check_index_type=False,
+                                           check_names=False, check_freq=False, rtol=1e-12, obj=clave)
+        elif isinstance(esperado, dict):
+            assert obtenido == esperado, clave
+        else:
+            np.testing.assert_allclose(obtenido, esperado, rtol=1e-12, err_msg=clave)
+
+
+def test_intervalos_cubren_el_valor_real(replicado):
+    real = ag.calcular_kpis(replicado)
+    agentes_real = ag.tabla_agentes(replicado).set_index("Agent")["Resueltas"]
+
+    claves = ["resueltas", "pct_resueltas", "R_porSegundo_resueltas", "satisfaccion"]
+    cubre = {clave: 0 for clave in claves}
+    cubre_agentes, casos_agentes = 0, 0
+    resueltas = []
+    for semilla in SEMILLAS:
+        previa = vista_previa(replicado, tam=2_000, semilla=semilla)
+        for clave in claves:
+            cubre[clave] += abs(previa["kpis"][clave] - real[clave]) <= previa["ic"][clave]
+        agentes = previa["tabla_agentes"].set_index("Agent")
+        dentro = (agentes["Resueltas"] - agentes_real).abs() <= agentes["± Resueltas"]
+        cubre_agentes += int(dentro.sum())
+        casos_agentes += len(dentro)
+        resueltas.append(previa["kpis"]["resueltas"])
+
+    # IC del 95 %: con 40 muestras la cobertura observada no debería bajar del 85 %
+    for clave in claves:
+        assert cubre[clave] / len(SEMILLAS) >= 0.85, clave
+    assert cubre_agentes / casos_agentes >= 0.85
+
+    # Estimador insesgado: el promedio de las estimaciones queda cerca del total real
+    error_estandar = np.std(resueltas, ddof=1) / np.sqrt(len(resueltas))
+    assert abs(np.mean(resueltas) - real["resueltas"]) <= 3 * error_estandar
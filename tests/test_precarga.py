@@ -0,0 +1,104 @@
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import precarga
+from precarga import Programador
+
+
+@pytest.fixture
+def entorno(monkeypatch):
+    """Programador propio con tareas de prueba y una huella de dataset controlable."""
+    huella = {"actual": ("v1",)}
+    monkeypatch.setattr(precarga, "_huella_actual", lambda: huella["actual"])
+    monkeypatch.setattr(precarga, "TAREAS", {})
+    bloqueo = threading.Event()
+    llamadas = []
+
+    @precarga.tarea("bloquear")
+    def _bloquear():
+        # Ocupa el único hilo de trabajo hasta que el test lo libere
+        bloqueo.wait(5)
+        return "libre"
+
+    @precarga.tarea("dato")
+    def _dato():
+        llamadas.append(threading.current_thread().name)
+        return len(llamadas)
+
+    @precarga.tarea("falla")
+    def _falla():
+        llamadas.append("falla")
+        raise FileNotFoundError("sin dataset")
+
+    programador = Programador()
+    yield programador, huella, bloqueo, llamadas
+    bloqueo.set()
+    programador._executor.shutdown(wait=True)
+
+
+def test_registra_todas_las_tareas_al_importar():
+    # En un intérprete nuevo, sin importar detalle ni muestreo
+    salida = subprocess.run([sys.executable, "-c", "import precarga; print(sorted(precarga.TAREAS))"],
+                            capture_output=True, text=True, check=True).stdout
+    assert salida.strip() == "['almacen', 'llamadas', 'snapshot', 'vista_previa']"
+
+
+def test_tarea_repetida_corre_una_sola_vez(entorno):
+    programador, _, _, llamadas = entorno
+    futuro = programador.programar("dato")
+    assert programador.programar("dato") is futuro
+    assert futuro.result(5) == 1
+    assert programador.obtener("dato") == 1
+    assert len(llamadas) == 1
+
+
+def test_tarea_en_cola_se_adelanta_en_el_hilo_que_la_pide(entorno):
+    programador, _, bloqueo, llamadas = entorno
+    programador.programar("bloquear")
+    en_cola = programador.programar("dato")
+    assert programador.obtener("dato") == 1
+    assert llamadas == [threading.current_thread().name]
+    assert en_cola.done()
+
+    # Cuando el hilo de trabajo llega a la tarea ya resuelta, no la repite
+    bloqueo.set()
+    programador.obtener("bloquear")
+    assert len(llamadas) == 1
+
+
+def test_cambio_de_dataset_cancela_lo_pendiente(entorno):
+    programador, huella, bloqueo, llamadas = entorno
+    programador.programar("bloquear")
+    viejo = programador.programar("dato")
+
+    huella["actual"] = ("v2",)
+    nuevo = programador.programar("dato")
+    assert viejo.cancelled()
+    assert nuevo is not viejo
+
+    bloqueo.set()
+    assert nuevo.result(5) == 1
+    assert len(llamadas) == 1
+
+
+def test_precarga_fallida_no_se_reencola(entorno):
+    programador, huella, _, llamadas = entorno
+    fallido = programador.programar("falla")
+    assert isinstance(fallido.exception(5), FileNotFoundError)
+
+    # La precarga no insiste con la misma versión del dataset...
+    assert programador.programar("falla") is fallido
+    assert llamadas == ["falla"]
+
+    # ...pero quien necesita el resultado sí reintenta
+    with pytest.raises(FileNotFoundError):
+        programador.obtener("falla")
+    assert llamadas == ["falla", "falla"]
+
+    # Y con otra versión del dataset la precarga vuelve a intentarlo
+    huella["actual"] = ("v2",)
+    programador.programar("falla").exception(5)
+    assert llamadas == ["falla", "falla", "falla"]
@@ -0,0 +1,37 @@
+import os
+import shutil
+
+from datos import huella_dataset
+from snapshot import SNAPSHOT_VERSION, escribir_snapshot, leer_snapshot
+
+
+def test_huella_no_depende_de_ruta_ni_fecha(tmp_path):
+    original = tmp_path / "llamadas.xlsx"
+    original.write_bytes(b"contenido del dataset")
+    copia = tmp_path / "deploy" / "llamadas.xlsx"
+    copia.parent.mkdir()
+    shutil.copyfile(original, copia)
+    os.utime(copia, ns=(0, 10**18))
+
+    assert huella_dataset(str(copia)) == huella_dataset(str(original))
+
+    copia.write_bytes(b"contenido del dataset, actualizado")
+    assert huella_dataset(str(copia)) != huella_dataset(str(original))
+
+
+def test_snapshot_de_otra_version_del_dataset_se_descarta(tmp_path):
+    dataset = tmp_path / "llamadas.xlsx"
+    dataset.write_bytes(b"v1")
+    ruta = str(tmp_path / "snapshot.pkl")
+    escribir_snapshot({"version": SNAPSHOT_VERSION, "huella": huella_dataset(str(dataset))}, ruta)
+
+    # Copiado o "tocado" sin cambios: el snapshot sigue valiendo
+    os.utime(dataset, ns=(0, 10**18))
+    assert leer_snapshot(ruta, str(dataset)) is not None
+
+    dataset.write_bytes(b"v2")
+    assert leer_snapshot(ruta, str(dataset)) is None
+
+    # Sin dataset (despliegue solo con snapshot) se usa el snapshot guardado
+    dataset.unlink()
+    assert leer_snapshot(ruta, str(dataset)) is not None